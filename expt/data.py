@@ -26,10 +26,12 @@ of hypotheses or algorithms applied over different environments or dataset).
 from __future__ import annotations
 
 import collections
+import concurrent.futures
 import copy
 import dataclasses
 import difflib
 import fnmatch
+import functools
 from importlib import import_module as _import
 import itertools
 import os.path
@@ -43,7 +45,6 @@ from typing_extensions import Literal
 import numpy as np
 import pandas as pd
 from pandas.core.groupby.generic import DataFrameGroupBy
-import scipy.interpolate
 from typeguard import typechecked
 
 from expt import util
@@ -62,6 +63,26 @@ else:
 RunConfig = Mapping[str, Any]
 
 
+@dataclasses.dataclass(frozen=True)
+class RunMetadata:
+  """Shape information of a Run, which can be obtained without reading
+  the data in the DataFrame."""
+  rows: int
+  columns: Tuple[Hashable, ...]
+  index_range: Optional[Tuple[Any, Any]]  # (min, max); None if empty.
+
+  @classmethod
+  def of(cls, df: pd.DataFrame) -> RunMetadata:
+    index = df.index
+    if len(index) == 0:
+      index_range = None
+    elif index.is_monotonic_increasing:
+      index_range = (index[0], index[-1])
+    else:
+      index_range = (index.min(), index.max())
+    return cls(rows=len(df), columns=tuple(df.columns), index_range=index_range)
+
+
 @dataclasses.dataclass
 class Run:
   """Represents a single run, containing one pd.DataFrame object
@@ -77,12 +98,16 @@ class Run:
     if isinstance(o, Run):
       return Run(path=o.path, df=o.df)
     elif isinstance(o, pd.DataFrame):
-      return cls.from_dataframe(o)
+      return cls._from_dataframe(o)
     raise TypeError("Unknown type {}".format(type(o)))
 
   @classmethod
   @typechecked
   def from_dataframe(cls, df: pd.DataFrame):
+    return cls._from_dataframe(df)
+
+  @classmethod
+  def _from_dataframe(cls, df: pd.DataFrame):
     run = cls(path='', df=df)
     if hasattr(df, 'path'):
       run.path = df.path
@@ -97,6 +122,11 @@ class Run:
     """Returns all column names."""
     return list(self.df.columns)  # type: ignore
 
+  @property
+  def metadata(self) -> RunMetadata:
+    """Returns the number of rows, columns, and index (step) range."""
+    return RunMetadata.of(self.df)
+
   @property
   def name(self) -> str:
     """Returns the last segment of the path."""
@@ -151,6 +181,7 @@ class RunList(Sequence[Run]):
   def __init__(self, runs: Run | Iterable[Run]):
     runs = self._validate_type(runs)
     self._runs: List[Run] = list(runs)
+    self._cache: Dict[str, Any] = {}
 
   @classmethod
   def of(cls, runs: Iterable[Run]):
@@ -159,7 +190,18 @@ class RunList(Sequence[Run]):
     else:
       return cls(runs)  # RunList(runs)
 
+  @classmethod
+  def _trusted(cls, runs: List[Run]) -> RunList:
+    """Create a RunList that takes the list `runs` without validation.
+    For internal use only, where `runs` is known to contain only Runs."""
+    o = cls.__new__(cls)
+    o._runs = runs
+    o._cache = {}
+    return o
+
   def _validate_type(self, runs) -> List[Run]:
+    if isinstance(runs, RunList):
+      return list(runs._runs)  # Already validated.
     if not isinstance(runs, Iterable):
       raise TypeError(f"`runs` must be a Iterable, but given {type(runs)}")
     if isinstance(runs, Mapping):
@@ -198,6 +240,37 @@ class RunList(Sequence[Run]):
 
   def extend(self, more_runs: Iterable[Run]):
     self._runs.extend(more_runs)
+    self._cache.clear()
+
+  def _config_table(self, config_fn: Callable[[Run], RunConfig]):
+    """Get the (cached) config table of the runs. Only the table for the
+    most recently used config_fn is kept, until the config of any run is
+    replaced (in-place modification of a config is not detected)."""
+    configs = [r.config for r in self._runs]
+    cached = self._cache.get('config_table', None)
+    stale = cached is None or cached[0] is not config_fn or any(
+        c is not cached_c for c, cached_c in zip(configs, cached[1]))
+    if stale:
+      cached = (config_fn, configs, _ConfigTable.build(self._runs, config_fn))
+      self._cache['config_table'] = cached
+    return cached[2]
+
+  _MAX_CACHED_QUERIES = 256
+
+  def _match(self, attr: str, pattern: str | re.Pattern) -> RunList:
+    """Select runs whose `attr` (name or path) matches the pattern, with
+    the index of distinct strings and the results cached until extend()."""
+    queries = self._cache.setdefault('queries', {})
+    key = (attr, pattern)
+    if key not in queries:
+      index_key = f'{attr}_index'
+      if index_key not in self._cache:
+        self._cache[index_key] = _StringIndex.build(
+            getattr(r, attr) for r in self._runs)
+      if len(queries) >= self._MAX_CACHED_QUERIES:
+        queries.clear()
+      queries[key] = self._cache[index_key].match(pattern)
+    return RunList._trusted([self._runs[i] for i in queries[key]])
 
   def to_list(self) -> List[Run]:
     """Create a new copy of list containing all the runs."""
@@ -278,58 +351,56 @@ class RunList(Sequence[Run]):
         or hypothesis as additional columns in the returning dataframe.
         See Hypothesis.summary().
     """
-    df = pd.DataFrame({
-        'name': [r.name for r in self._runs],
-        'run': self._runs,
-    })
-
+    # Collect the config values for each key in one pass (column-wise),
+    # and create the dataframe (and its index) at once.
+    config_columns: Dict[str, np.ndarray] = {}
     config_keys = []
     if include_config:
       if config_fn is None:
         config_fn = _default_config_fn
 
+      table = self._config_table(config_fn)
       if index_keys is None:  # using default index
-        index_keys = varied_config_keys(self._runs, config_fn=config_fn)
-
-      for i, run in enumerate(self._runs):
-        config: Mapping[str, Any] = config_fn(run)
-        if not isinstance(config, Mapping):
-          raise ValueError("config_fn should return a dict-like object.")
-
-        r_keys = index_keys
-        for k in r_keys:
-          if k not in config:
+        index_keys = table.varied_keys()
+
+      index_keys = list(index_keys)
+      config_columns = {
+          k: np.empty(len(self._runs), dtype=object) for k in index_keys
+      }
+      rows = zip(self._runs, table.configs, table.flat_configs)
+      for i, (run, config, flat_config) in enumerate(rows):
+        for k in index_keys:
+          if k in flat_config:  # Note: lists are converted into tuples.
+            v = flat_config[k]
+          elif k in config:  # e.g. a nested config, not flattened.
+            v = config[k]
+          else:
             raise ValueError(
                 f"'{k}' not found in the config of {run}. Close matches: " +
-                str(difflib.get_close_matches(k, config.keys())))
-          v = config[k]
-          if isinstance(v, list):
-            # list is not hashable and not immutable, convert to a tuple.
-            v = tuple(v)
-
-          dtype = np.array(v).dtype
-          if k not in df:
-            # Create a new column if not exists
-            # TODO: Consider NaN as a placeholder value rather than empty str.
-            df[k] = pd.Series([''] * len(self._runs), dtype=object)
-            if k not in index_excludelist:
-              config_keys.append(k)
-
-          try:
-            df.at[i, k] = v
-          except ValueError as e:
-            raise ValueError(f"Failed to assign index for '{k}' "
-                             f"with type {type(v)}") from e
-
-    # Move 'name' and 'run' to the rightmost column.
-    df.insert(len(df.columns) - 1, 'name', df.pop('name'))
-    df.insert(len(df.columns) - 1, 'run', df.pop('run'))
-
-    # Automatically set multi-index.
-    if config_keys:
-      df = df.set_index(config_keys, inplace=False)  # type: ignore
+                str(difflib.get_close_matches(
+                    k, util.merge_list(config.keys(), flat_config.keys()))))
+          config_columns[k][i] = v
+
+      config_keys = [
+          k for k in config_columns
+          if k not in index_excludelist and k not in ('name', 'run')
+      ]
+
+    # 'name' and 'run' are the rightmost columns.
+    columns = {
+        **{k: v for k, v in config_columns.items() if k not in config_keys},
+        'name': config_columns.get('name', [r.name for r in self._runs]),
+        'run': config_columns.get('run', self._runs),
+    }
+
+    if not config_keys:
+      df = pd.DataFrame(columns)
+    else:
+      # Automatically set multi-index.
+      index = pd.MultiIndex.from_arrays(
+          [config_columns[k] for k in config_keys], names=config_keys)
+      df = pd.DataFrame(columns, index=index)
       df = df.sort_index(inplace=False)  # type: ignore
-      assert df is not None
 
       # pandas groupby(dropna=...) has a bug that rows with any nan value
       # in the multi-index will be incorrectly dropped (see pandas#36060)
@@ -356,7 +427,8 @@ class RunList(Sequence[Run]):
         # Note that config lies in the (multi)index.
         group_config: Dict[str, Any] = dict(zip(g.index.names, g.index[0]))
         h_name = hypothesis_namer(group_config, g.run.values)
-        return Hypothesis(h_name, g['run'].values, config=group_config)
+        return Hypothesis._trusted(h_name, RunList._trusted(list(g['run'])),
+                                   config=group_config)
 
       # yapf: disable
       df = (df
@@ -393,12 +465,8 @@ class RunList(Sequence[Run]):
     If a regex Pattern (re.compile) is given, all the runs whose name matches
     the pattern in part (via re.search) will be selected.
     """
-    if isinstance(fn, str):
-      pat = str(fn)
-      fn = lambda run: fnmatch.fnmatch(run.name, pat)
-    elif isinstance(fn, re.Pattern):
-      pat = fn
-      fn = lambda run: bool(pat.search(run.name))
+    if isinstance(fn, (str, re.Pattern)):
+      return self._match('name', fn)
     return RunList(filter(fn, self._runs))
 
   def grep(self, regex: str | re.Pattern, flags=0):
@@ -406,7 +474,7 @@ class RunList(Sequence[Run]):
     matched `Run`s as a RunList."""
     if isinstance(regex, str):
       regex = re.compile(regex, flags=flags)
-    return self.filter(lambda r: bool(regex.search(r.path)))
+    return self._match('path', regex)
 
   def map(self, func: Callable[[Run], Any]) -> List:
     """Apply func for each of the runs. Return the transformation
@@ -444,12 +512,22 @@ class RunList(Sequence[Run]):
       >>>   ...
 
     """
-    series = pd.Series(self._runs)
-    groupby = series.groupby(lambda i: by(series[i]))
-
-    group: T
-    for group, runs_in_group in groupby:  # type: ignore
-      yield group, Hypothesis.of(runs_in_group, name=name(group))
+    groups: Dict[T, List[Run]] = {}
+    for run in self._runs:
+      key = by(run)
+      if key is None or (isinstance(key, float) and np.isnan(key)):
+        continue  # Like pandas groupby, NA keys are excluded.
+      groups.setdefault(key, []).append(run)
+
+    keys: List[T] = list(groups.keys())
+    try:
+      keys = sorted(keys)  # type: ignore
+    except TypeError:
+      pass  # Not comparable, use the order of appearance.
+
+    for group in keys:
+      runs_in_group = RunList._trusted(groups[group])
+      yield group, Hypothesis._trusted(name(group) or '', runs_in_group)
 
   def extract(self, pat: str, flags: int = 0) -> pd.DataFrame:
     r"""Extract capture groups in the regex pattern `pat` as columns.
@@ -470,26 +548,568 @@ class RunList(Sequence[Run]):
     return df
 
 
+def _flatten_config(config: Mapping[str, Any], prefix: str = '') -> Dict:
+  """Flatten a nested config, e.g. {'a': {'b': 1}} into {'a__b': 1}.
+  Lists are converted into tuples.
+
+  Nested keys are joined with '__' rather than '.', so that they remain valid
+  names in a query, e.g. `Experiment.select("a__b == 1")`.
+  """
+  flat = {}
+  for k, v in config.items():
+    key = f"{prefix}{k}" if prefix else k
+    if isinstance(v, Mapping) and v:
+      flat.update(_flatten_config(v, prefix=f"{key}__"))
+    elif isinstance(v, list):
+      flat[key] = tuple(v)
+    else:
+      flat[key] = v
+  return flat
+
+
+@dataclasses.dataclass(frozen=True)
+class _ConfigTable:
+  """The (flattened) configs of a list of runs, computed only once.
+
+  Equal values for each key are interned, i.e. share the same object.
+  """
+  configs: List[RunConfig]  # config_fn(run) for each run.
+  flat_configs: List[Dict[str, Any]]  # flattened configs.
+  unique_values: Dict[str, Dict[Hashable, Any]]  # key -> unique values.
+
+  @classmethod
+  def build(cls, runs: Iterable[Run],
+            config_fn: Callable[[Run], RunConfig]) -> _ConfigTable:
+    configs, flat_configs = [], []
+    unique_values: Dict[str, Dict[Hashable, Any]] = {}
+    for r in runs:
+      config = config_fn(r)
+      if not isinstance(config, Mapping):
+        raise ValueError("config_fn should return a dict-like object.")
+      flat = _flatten_config(config)
+      for k, v in flat.items():
+        try:
+          h = (v, type(v))  # Note that 1 == 1.0 == True.
+          hash(h)
+        except TypeError:
+          h = str(v)  # for instance, list is not hashable, e.g., "[64, 64]"
+        flat[k] = unique_values.setdefault(k, {}).setdefault(h, v)
+      configs.append(config)
+      flat_configs.append(flat)
+    return cls(configs, flat_configs, unique_values)
+
+  def varied_keys(self) -> Tuple[str, ...]:
+
+    def _num_distinct(values: Dict[Hashable, Any]) -> int:
+      # Values are distinct by equality (e.g. 1 == 1.0), not by type.
+      return len(set(h[0] if isinstance(h, tuple) else h for h in values))
+
+    keys = tuple(k for (k, values) in self.unique_values.items()
+                 if _num_distinct(values) > 1)
+    if not keys:
+      # All the runs have identical config, so use all of them
+      return tuple(self.unique_values.keys())
+    return keys
+
+
 def varied_config_keys(
     runs: Sequence[Run],
     config_fn: Callable[[Run], RunConfig] = _default_config_fn,
 ) -> Sequence[str]:
   """Get a list of config keys (or indices in to_dataframe) that have more than
   two different unique values. If all the configs are identical, the list
-  will contain all the unique config keys existing in any of the runs."""
+  will contain all the unique config keys existing in any of the runs.
+  Nested configs are flattened, e.g. {'a': {'b': 1}} has the key 'a__b'."""
+
+  if isinstance(runs, RunList):
+    table = runs._config_table(config_fn)
+  else:
+    table = _ConfigTable.build(runs, config_fn)
+  return table.varied_keys()
+
+
+@dataclasses.dataclass(frozen=True)
+class _StringIndex:
+  """An index of strings (e.g. names or paths of runs), where a pattern is
+  matched only once against each of the distinct strings."""
+  values: List[str]  # distinct strings.
+  positions: List[List[int]]  # positions of each distinct string.
+
+  @classmethod
+  def build(cls, strings: Iterable[str]) -> _StringIndex:
+    positions: Dict[str, List[int]] = {}
+    for i, s in enumerate(strings):
+      positions.setdefault(s, []).append(i)
+    return cls(list(positions.keys()), list(positions.values()))
+
+  def match(self, pattern: str | re.Pattern) -> List[int]:
+    """Returns the (sorted) positions of the strings matching `pattern`,
+    either a fnmatch pattern (str) or a regex (via re.search)."""
+    if isinstance(pattern, str):
+      matched = set(fnmatch.filter(self.values, pattern))
+      hits = [s in matched for s in self.values]
+    else:
+      hits = [pattern.search(s) is not None for s in self.values]
+    return sorted(itertools.chain.from_iterable(
+        p for (p, hit) in zip(self.positions, hits) if hit))
+
+
+def _freeze(o: Any) -> Hashable:
+  """Convert a (nested) dict or list into a hashable object."""
+  if isinstance(o, Mapping):
+    return tuple(sorted((k, _freeze(v)) for k, v in o.items()))
+  if isinstance(o, (list, tuple)):
+    return tuple(_freeze(v) for v in o)
+  return o
+
+
+def _interpolate_linear(x: np.ndarray, y: np.ndarray,
+                        x_new: np.ndarray) -> np.ndarray:
+  """Linearly interpolate each column of `y` (n x c) sampled at `x` (n,)
+  onto `x_new` (m,), extrapolating outside the range of `x`.
+
+  For each column, this gives the same (m,) values as
+  `scipy.interpolate.interp1d(x, y[:, j], fill_value="extrapolate")(x_new)`
+  using only the non-NaN values of the column, but all the columns that
+  share the same NaN pattern are interpolated at once. Columns with less
+  than two non-NaN values will be all NaN.
+  """
+  y_new = np.full((len(x_new), y.shape[1]), np.nan)
+  valid = ~np.isnan(y)
+
+  groups: Dict[bytes, List[int]] = {}
+  if y.size and valid.all():
+    groups[b''] = list(range(y.shape[1]))
+  else:
+    for j in range(y.shape[1]):
+      groups.setdefault(np.packbits(valid[:, j]).tobytes(), []).append(j)
+
+  for cols in groups.values():
+    rows = np.flatnonzero(valid[:, cols[0]])
+    if len(rows) < 2:
+      continue  # Insufficient data due to a empty/crashed run.
+
+    order = np.argsort(x[rows], kind='mergesort')
+    xs = x[rows][order]
+    ys = y[np.ix_(rows[order], cols)]
+
+    # See scipy.interpolate.interp1d._call_linear.
+    hi = np.searchsorted(xs, x_new).clip(1, len(xs) - 1)
+    lo = hi - 1
+    slope = (ys[hi] - ys[lo]) / (xs[hi] - xs[lo])[:, None]
+    y_new[:, cols] = slope * (x_new - xs[lo])[:, None] + ys[lo]
+
+  return y_new
+
+
+def _numeric_numpy_dtype(dtype) -> Optional[np.dtype]:
+  """The numpy dtype of a numeric (int, uint, float) column, including
+  pyarrow-backed (pd.ArrowDtype) or sparse ones; None if not numeric."""
+  arrow_dtype = getattr(pd, 'ArrowDtype', None)  # pandas >= 1.5
+  if arrow_dtype is not None and isinstance(dtype, arrow_dtype):
+    dtype = dtype.numpy_dtype
+  elif isinstance(dtype, pd.SparseDtype):
+    dtype = dtype.subtype
+  if isinstance(dtype, np.dtype) and dtype.kind in 'iuf':
+    return dtype
+  return None
+
+
+def _dense_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+  """The dataframe with sparse columns (pd.SparseDtype) made dense."""
+  astype = {
+      column: dtype.subtype
+      for column, dtype in df.dtypes.items()
+      if isinstance(dtype, pd.SparseDtype)
+  }
+  return df.astype(astype) if astype else df
+
+
+def _is_non_numeric_dtype(dtype) -> bool:
+  """Whether the dtype is categorical or string (of any storage), which is
+  excluded by numeric_only."""
+  return (isinstance(dtype, pd.CategoricalDtype) or
+          pd.api.types.is_string_dtype(dtype))
+
+
+@dataclasses.dataclass(frozen=True)
+class _AlignedRuns:
+  """The numeric data of runs as a (runs x steps x columns) float array,
+  aligned on the sorted union of their indices, where missing entries are NaN.
+  The array has the common dtype of the columns (e.g. float32 if all of them
+  are float32), rather than always float64, to save memory.
+
+  Reductions along the run axis give the same result as
+  `pd.concat(dfs).groupby(level=0).<method>(numeric_only=True)`, except
+  that pyarrow-backed or sparse columns are reduced to numpy dtypes.
+  """
+  index: pd.Index
+  columns: pd.Index
+  dtypes: List[np.dtype]  # The dtype of each column after pd.concat().
+  values: np.ndarray
+  counts: np.ndarray  # The number of non-missing values, (steps x columns).
+
+  # The maximum size of the aligned array, relative to the total number of
+  # rows of runs; otherwise runs barely share steps (e.g., logged at every
+  # episode), where the dense array would take much more memory than pandas.
+  MAX_EXPANSION = 2.0
+
+  @classmethod
+  def build(cls, dfs: Sequence[pd.DataFrame]) -> Optional[_AlignedRuns]:
+    """Returns None if the dataframes cannot be aligned (e.g. non-numeric
+    or non-unique index, non-numpy dtypes, or too few shared steps), where
+    pandas should be used."""
+    if not dfs:
+      return None
+
+    index_dtype = dfs[0].index.dtype
+    for df in dfs:
+      if not (isinstance(df.index.dtype, np.dtype) and
+              df.index.dtype == index_dtype and index_dtype.kind in 'iuf'):
+        return None
+      if not df.index.is_unique or df.index.hasnans:
+        return None
+      if not df.columns.is_unique:
+        return None
+
+    column_dtypes: Dict[Hashable, List[Any]] = {}
+    for df in dfs:
+      for column, dtype in df.dtypes.items():
+        column_dtypes.setdefault(column, []).append(dtype)
+
+    columns, dtypes = [], []
+    for column, dts in column_dtypes.items():
+      if any(_is_non_numeric_dtype(dtype) for dtype in dts):
+        continue  # Non-numeric columns are excluded by numeric_only.
+      numpy_dtypes = [_numeric_numpy_dtype(dtype) for dtype in dts]
+      if any(dtype is None for dtype in numpy_dtypes):
+        return None  # e.g. bool, datetime, or other extension types.
+      dtype = np.result_type(*numpy_dtypes)
+      if len(dts) < len(dfs) and dtype.kind != 'f':
+        dtype = np.dtype(float)  # Missing values are filled with NaN.
+      columns.append(column)
+      dtypes.append(dtype)
+
+    index_names = set(df.index.name for df in dfs)
+    index = pd.Index(
+        np.unique(np.concatenate([df.index.to_numpy() for df in dfs])),
+        name=index_names.pop() if len(index_names) == 1 else None)
+    num_rows = max(sum(len(df) for df in dfs), 1)
+    if len(dfs) * len(index) > cls.MAX_EXPANSION * num_rows:
+      return None
+
+    value_dtype = np.result_type(*dtypes) if dtypes else np.dtype(float)
+    if value_dtype.kind != 'f':
+      value_dtype = np.dtype(float)  # Missing values are filled with NaN.
 
-  key_values = collections.defaultdict(set)
-  for r in runs:
-    for k, v in config_fn(r).items():
-      if not isinstance(v, Hashable):
-        v = str(v)  # for instance, list is not hashable, e.g., "[64, 64]"
-      key_values[k].add(v)
+    positions = {column: j for j, column in enumerate(columns)}
+    run_columns = [[c for c in df.columns if c in positions] for df in dfs]
+    shape = (len(dfs), len(index), len(columns))
+    num_entries = sum(len(df) * len(c) for df, c in zip(dfs, run_columns))
+    if num_entries == np.prod(shape):
+      values = np.empty(shape, dtype=value_dtype)  # No entry is missing.
+    else:
+      values = np.full(shape, np.nan, dtype=value_dtype)
+    for i, (df, df_columns) in enumerate(zip(dfs, run_columns)):
+      rows = _as_slice(index.get_indexer(df.index))
+      cols = _as_slice(np.array([positions[c] for c in df_columns],
+                                dtype=np.intp))
+      if len(df_columns) < len(df.columns):
+        df = df[df_columns]
+      if isinstance(rows, slice) and isinstance(cols, slice):
+        ix = (rows, cols)  # A view, which is much faster than fancy indexing.
+      else:
+        ix = np.ix_(np.r_[rows], np.r_[cols])
+      values[i][ix] = df.to_numpy(dtype=value_dtype,
+                                  na_value=np.nan)  # Arrow nulls as NaN.
+
+    return cls(index=index,
+               columns=pd.Index(columns),
+               dtypes=dtypes,
+               values=values,
+               counts=len(dfs) - np.isnan(values).sum(axis=0))
+
+  def _reduce(self, method: str) -> np.ndarray:
+    if method not in ('mean', 'std', 'min', 'max'):
+      raise ValueError(f"Unknown reduction: {method}")
+    # The mean and std are accumulated in float64, even for float32 values.
+    n = len(self.values)
+    if self.counts.size == 0 or self.counts.min() == n:
+      if method in ('min', 'max'):
+        return getattr(np, method)(self.values, axis=0)
+      elif method == 'mean':
+        return np.mean(self.values, axis=0, dtype=np.float64)
+      elif n > 1:
+        return np.std(self.values, axis=0, ddof=1, dtype=np.float64)
+
+    # Equivalent to np.nanmean, etc., but the mask is not stored to save memory.
+    mask, counts = np.isnan(self.values), self.counts
+    if method in ('min', 'max'):
+      fill = np.inf if method == 'min' else -np.inf
+      values = getattr(np.where(mask, fill, self.values), method)(axis=0)
+      return np.where(counts > 0, values, np.nan)
+
+    total = np.where(mask, 0, self.values).sum(axis=0, dtype=np.float64)
+    mean = total / counts
+    if method == 'mean':
+      return mean
+    var = self._sum_of_squares(mean) / (counts - 1)
+    return np.where(counts > 1, np.sqrt(var), np.nan)
+
+  def _sum_of_squares(self, mean: np.ndarray) -> np.ndarray:
+    """The sum of squared deviations from the mean along the run axis,
+    skipping missing values."""
+    deviation = self.values - mean  # float64
+    if self.counts.size and self.counts.min() < len(self.values):
+      deviation[np.isnan(deviation)] = 0.0
+    return np.square(deviation, out=deviation).sum(axis=0)
+
+  def reduce(self, method: str) -> pd.DataFrame:
+    """Reduce along the run axis, e.g. method='mean'."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+      # All-NaN slices or too few samples should silently yield NaN.
+      values = self._reduce(method)
+
+    df = pd.DataFrame(values, index=self.index, columns=self.columns)
+    keep_integer = method in ('min', 'max')
+    astype = {
+        column: dtype
+        for column, dtype in zip(self.columns, self.dtypes)
+        if dtype != np.float64 and (dtype.kind == 'f' or keep_integer)
+    }
+    return df.astype(astype) if astype else df
+
+
+class _RunningMoments:
+  """Running mean and variance at each (step, column) over runs, using
+  Welford's online algorithm, which can be updated with new rows of runs.
+
+  Reductions give the same result as `_AlignedRuns.reduce()` for mean and std
+  (up to floating point errors), but an update with the rows appended to runs
+  costs much less than a rebuild: checking that the rows fed before remain
+  the same is a cheap comparison of arrays. The moments are derived from the
+  aligned array of runs (see from_aligned()), and only updated from there.
+  """
 
-  keys = tuple(k for (k, values) in key_values.items() if len(values) > 1)
-  if not keys:
-    # All the runs have identical config, so use all of them
-    return tuple(key_values.keys())
-  return keys
+  def __init__(self):
+    # The dataframe, number of rows, columns, and index name of each run,
+    # as of the last update.
+    self._fed: List[Tuple[pd.DataFrame, int, Tuple, Any]] = []
+    self._index_dtype: Optional[np.dtype] = None
+    self._steps = pd.Index([])  # The step of each row in the arrays.
+    self._columns: Dict[Hashable, int] = {}  # column -> column in the arrays.
+    self._dtypes: Dict[Hashable, np.dtype] = {}
+    self._skipped: set = set()  # Non-numeric columns.
+    self._count = np.zeros((0, 0), dtype=np.int64)
+    self._mean = np.zeros((0, 0))
+    self._m2 = np.zeros((0, 0))  # The sum of squared deviations.
+
+  @classmethod
+  def from_aligned(cls, aligned: _AlignedRuns,
+                   dfs: Sequence[pd.DataFrame]) -> _RunningMoments:
+    """The moments of runs (the dataframes `aligned` was built from)."""
+    moments = cls()
+    moments._fed = [
+        (df, len(df), tuple(df.columns), df.index.name) for df in dfs
+    ]
+    moments._index_dtype = aligned.index.dtype
+    moments._steps = aligned.index.rename(None)
+    moments._columns = {c: j for j, c in enumerate(aligned.columns)}
+    moments._dtypes = dict(zip(aligned.columns, aligned.dtypes))
+    moments._skipped = set(
+        c for df in dfs for c in df.columns if c not in moments._columns)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+      mean = aligned._reduce('mean')
+    moments._count = aligned.counts.astype(np.int64)
+    moments._m2 = aligned._sum_of_squares(mean)
+    moments._mean = np.where(moments._count > 0, mean, 0.0)
+    return moments
+
+  def update(self, dfs: Sequence[pd.DataFrame]) -> bool:
+    """Feed the rows of runs added since the last update.
+
+    The dataframe of a run is regarded as appended to (as logs only grow) if
+    it is a new dataframe whose first rows are the same as the rows fed
+    before (in the index and the numeric columns), with the same columns.
+    Returns False if the runs have changed otherwise or cannot be aligned,
+    where the moments are no longer valid.
+    """
+    if not dfs or len(dfs) < len(self._fed):
+      return False
+
+    updates = []  # (i, df, the new rows, numeric columns)
+    for i, df in enumerate(dfs):
+      n_rows = 0
+      if i < len(self._fed):
+        fed_df, n_rows, columns, _ = self._fed[i]
+        if fed_df is df:
+          # Nothing new, unless modified in place (e.g. rows enlarged), where
+          # the rows fed before cannot be verified.
+          if len(df) == n_rows:
+            continue
+          return False
+        if len(df) < n_rows or tuple(df.columns) != columns:
+          return False
+        if not self._same_rows(fed_df, df.iloc[:n_rows]):
+          return False
+        if len(df) == n_rows:
+          self._fed[i] = (df, n_rows, columns, df.index.name)
+          continue
+      numeric_columns = self._numeric_columns(df)
+      if numeric_columns is None:
+        return False
+      new_rows = df.iloc[n_rows:]
+      if not new_rows.index.is_unique or new_rows.index.hasnans:
+        return False
+      updates.append((i, df, new_rows, numeric_columns))
+    if not updates:
+      return True
+
+    # Add the new steps in the order of appearance, at once.
+    new_steps = pd.Index(
+        np.concatenate([u[2].index.to_numpy() for u in updates]),
+        dtype=self._index_dtype)
+    if len(self._steps):
+      new_steps = new_steps[self._steps.get_indexer(new_steps) < 0]
+      self._steps = self._steps.append(new_steps.unique())
+    else:
+      self._steps = new_steps.unique()
+
+    for column in itertools.chain.from_iterable(u[3] for u in updates):
+      self._columns.setdefault(column, len(self._columns))
+    self._reserve(len(self._steps), len(self._columns))
+
+    for i, df, new_rows, numeric_columns in updates:
+      rows = self._steps.get_indexer(new_rows.index)
+      cols = np.array([self._columns[c] for c in numeric_columns],
+                      dtype=np.intp)
+      values = new_rows[numeric_columns].to_numpy(dtype=float,
+                                                  na_value=np.nan,
+                                                  copy=True)
+      self._feed(_as_slice(rows), _as_slice(cols), values)
+      self._fed[i:i + 1] = [(df, len(df), tuple(df.columns), df.index.name)]
+    return True
+
+  def _same_rows(self, fed_df: pd.DataFrame, df: pd.DataFrame) -> bool:
+    """Whether the rows of `df` are the same as `fed_df` (fed before), in
+    the index and the numeric columns."""
+    if not df.index.equals(fed_df.index):
+      return False
+    columns = [c for c in fed_df.columns if c in self._columns]
+    if len(columns) < len(fed_df.columns):
+      df, fed_df = df[columns], fed_df[columns]
+    # Compared bitwise, which is much faster than with equal_nan=True;
+    # a false negative (e.g. -0.0 and 0.0) only causes a rebuild.
+    values, fed_values = (
+        d.to_numpy(dtype=np.float64, na_value=np.nan) for d in (df, fed_df))
+    return np.array_equal(values.view(np.uint64), fed_values.view(np.uint64))
+
+  def _numeric_columns(self, df: pd.DataFrame) -> Optional[List[Hashable]]:
+    """The numeric columns of a run, or None if it cannot be aligned."""
+    if self._index_dtype is None:
+      self._index_dtype = df.index.dtype
+    if not (isinstance(df.index.dtype, np.dtype) and
+            df.index.dtype == self._index_dtype and
+            self._index_dtype.kind in 'iuf'):
+      return None
+    if not df.columns.is_unique:
+      return None
+
+    columns = []
+    for column, dtype in df.dtypes.items():
+      if _is_non_numeric_dtype(dtype):
+        if column in self._dtypes:
+          return None
+        self._skipped.add(column)  # Excluded by numeric_only.
+        continue
+      numpy_dtype = _numeric_numpy_dtype(dtype)
+      if numpy_dtype is None or column in self._skipped:
+        return None
+      self._dtypes[column] = np.result_type(
+          self._dtypes.get(column, numpy_dtype), numpy_dtype)
+      columns.append(column)
+    return columns
+
+  def _reserve(self, n_rows: int, n_columns: int):
+    """Grow the arrays (amortized) to hold the given number of entries."""
+    rows, columns = self._count.shape
+    if n_rows <= rows and n_columns <= columns:
+      return
+    shape = (max(n_rows, 2 * rows), max(n_columns, 2 * columns))
+    for name in ('_count', '_mean', '_m2'):
+      old = getattr(self, name)
+      new = np.zeros(shape, dtype=old.dtype)
+      new[:rows, :columns] = old
+      setattr(self, name, new)
+
+  def _feed(self, rows, cols, values: np.ndarray):
+    """Welford's update with the values of a run at the given rows/columns,
+    where NaN values are skipped. `values` is overwritten."""
+    if isinstance(rows, slice) and isinstance(cols, slice):
+      ix = (rows, cols)  # A view, which is much faster than fancy indexing.
+    else:
+      ix = np.ix_(np.r_[rows], np.r_[cols])
+    missing = np.isnan(values)
+    count = self._count[ix] + ~missing
+    mean = self._mean[ix]
+    delta = values - mean
+    if missing.any():
+      delta[missing] = 0.0
+      mean += delta / np.maximum(count, 1)
+      correction = np.subtract(values, mean, out=values)
+      correction[missing] = 0.0
+    else:
+      mean += delta / count
+      correction = np.subtract(values, mean, out=values)
+    self._m2[ix] += delta * correction
+    self._count[ix] = count
+    self._mean[ix] = mean
+
+  def reduce(self, method: str) -> pd.DataFrame:
+    """Reduce along the run axis, method='mean' or 'std' (ddof=1)."""
+    if method not in ('mean', 'std'):
+      raise ValueError(f"Unknown reduction: {method}")
+
+    # The order of columns and steps as in _AlignedRuns.
+    columns = [
+        c for c in dict.fromkeys(
+            itertools.chain.from_iterable(fed[2] for fed in self._fed))
+        if c in self._columns
+    ]
+    order = self._steps.argsort()
+    ix = np.ix_(order, [self._columns[c] for c in columns])
+
+    count = self._count[ix]
+    with np.errstate(divide='ignore', invalid='ignore'):
+      if method == 'mean':
+        values = np.where(count > 0, self._mean[ix], np.nan)
+      else:
+        values = np.where(count > 1, np.sqrt(self._m2[ix] / (count - 1)),
+                          np.nan)
+
+    index_names = set(fed[3] for fed in self._fed)
+    df = pd.DataFrame(
+        values,
+        index=pd.Index(
+            self._steps[order],
+            name=index_names.pop() if len(index_names) == 1 else None),
+        columns=pd.Index(columns))
+    astype = {
+        c: self._dtypes[c]
+        for c in columns
+        if self._dtypes[c].kind == 'f' and self._dtypes[c] != np.float64
+    }
+    return df.astype(astype) if astype else df
+
+
+def _as_slice(positions: np.ndarray) -> Union[slice, np.ndarray]:
+  """A slice equivalent to the positions if consecutive, for faster indexing."""
+  n = len(positions)
+  if n and positions[-1] - positions[0] + 1 == n:
+    if np.all(np.diff(positions) == 1):
+      return slice(positions[0], positions[-1] + 1)
+  return positions
 
 
 @dataclasses.dataclass
@@ -498,6 +1118,11 @@ class Hypothesis(Iterable[Run]):
 
   A Hypothesis a group of runs with the same configuration; can represent a
   variant, algorithm, or such an instance with a specific set of hyperparamters.
+
+  Data derived from the runs (e.g., `grouped`, `mean()`, `std()`) is memoized
+  until the runs or their dataframes are replaced. Modifying the dataframe
+  of a run in place is not detected: assign a new dataframe to `run.df`
+  instead, or the results may be stale.
   """
   name: str
   runs: RunList
@@ -537,8 +1162,12 @@ class Hypothesis(Iterable[Run]):
         runs = Run.of(runs)
       runs = [runs]  # type: ignore
 
+    self._init(name, RunList(runs), style=style, config=config)
+
+  def _init(self, name: str, runs: RunList, *, style, config) -> None:
+    """Initialize fields; the common part of __init__() and _trusted()."""
     self.name = name
-    self.runs = RunList(runs)
+    self.runs = runs
 
     if config == 'auto':
       has_configs = [r.config is not None for r in self.runs]
@@ -554,6 +1183,30 @@ class Hypothesis(Iterable[Run]):
 
     self.config = config
     self.style = {**style} if style is not None else {}
+    self._cache: Dict[str, Any] = {}
+    self._moments: Optional[_RunningMoments] = None
+    # The runs and their aligned array as of the last aggregation, from which
+    # the running moments can be derived when rows are appended to the runs.
+    self._moments_seed: Optional[Tuple[_AlignedRuns,
+                                       List[pd.DataFrame]]] = None
+
+  @classmethod
+  def _trusted(
+      cls,
+      name: str,
+      runs: RunList,
+      *,
+      style: Optional[Dict[str, Any]] = None,
+      config: Union[RunConfig, Literal['auto'], None] = 'auto',
+  ) -> Hypothesis:
+    """Create a Hypothesis without the runtime type checks of __init__().
+
+    For internal use only, where the arguments are known to be valid, e.g.
+    rebuilding hypotheses from existing ones. `runs` is taken as-is (no copy).
+    """
+    h = cls.__new__(cls)
+    h._init(name, runs, style=style, config=config)
+    return h
 
   def __iter__(self) -> Iterator[Run]:
     return iter(self.runs)
@@ -647,8 +1300,25 @@ class Hypothesis(Iterable[Run]):
     return True
 
   def summary(self, **kwargs) -> pd.DataFrame:
-    """Return a DataFrame that summarizes the current hypothesis."""
-    return Experiment(self.name, [self]).summary(**kwargs)
+    """Return a DataFrame that summarizes the current hypothesis.
+
+    See Experiment.summary() for the arguments. The result is memoized for
+    the same arguments until the runs change, unless a custom `aggregate`
+    function is given (which would be a new object at every call).
+    """
+    aggregate = kwargs.get('aggregate', None)
+    if aggregate is not None and not isinstance(aggregate, _AggregateMeanLast):
+      return Experiment._trusted(self.name, [self]).summary(**kwargs)
+    try:
+      key = (self.name, _freeze(kwargs))
+      hash(key)
+    except TypeError:  # e.g. unhashable columns
+      return Experiment._trusted(self.name, [self]).summary(**kwargs)
+
+    summaries: Dict[Hashable, pd.DataFrame] = self._cached('summary', dict)
+    if key not in summaries:
+      summaries[key] = Experiment._trusted(self.name, [self]).summary(**kwargs)
+    return summaries[key].copy()
 
   if TYPE_CHECKING:  # Provide type hint and documentation for static checker.
     import expt.plot
@@ -662,11 +1332,20 @@ class Hypothesis(Iterable[Run]):
 
   @property
   def grouped(self) -> DataFrameGroupBy:
-    return pd.concat(self._dataframes, sort=False).groupby(level=0)
+    """The concatenated dataframes of all runs, grouped by index.
+
+    This is memoized until the runs change; in-place modification of the
+    dataframe of a run is not detected (see _cached())."""
+    return self._cached('grouped', lambda: self._concat.groupby(level=0))
+
+  @property
+  def _concat(self) -> pd.DataFrame:
+    return self._cached('concat',
+                        lambda: pd.concat(self._dataframes, sort=False))
 
   def empty(self) -> bool:
-    sentinel = object()
-    return next(iter(self.grouped), sentinel) is sentinel  # O(1)
+    """Returns True if none of the runs has any data."""
+    return all(len(df) == 0 for df in self._dataframes)  # O(#runs)
 
   @property
   def _dataframes(self) -> List[pd.DataFrame]:
@@ -680,6 +1359,129 @@ class Hypothesis(Iterable[Run]):
 
     return [_get_df(r) for r in self.runs]
 
+  def _cached(self, key: Hashable, fn: Callable[[], T]) -> T:
+    """Memoize data derived from the runs' dataframes.
+
+    The cache is invalidated when runs are replaced or added, or when the
+    dataframe of a run is replaced or reshaped. In-place modification of
+    the values in a dataframe is not detected.
+    """
+    signature = [(df, df.shape) for df in self._dataframes]
+    cache = self._cache
+    cached_signature = cache.get('signature', [])
+    if len(cached_signature) != len(signature) or any(
+        df is not cached_df or shape != cached_shape
+        for (df, shape), (cached_df, cached_shape) in zip(
+            signature, cached_signature)):
+      if self._moments is None and cache.get('aligned') is not None:
+        self._moments_seed = (cache['aligned'],
+                              [df for df, _ in cached_signature])
+      cache.clear()
+      cache['signature'] = signature  # Holds the dataframes alive.
+
+    if key not in cache:
+      cache[key] = fn()
+    return cache[key]
+
+  @property
+  def _aligned(self) -> Optional[_AlignedRuns]:
+
+    def _build() -> Optional[_AlignedRuns]:
+      # Only one of the aligned array or the running moments is kept.
+      self._moments = self._moments_seed = None
+      self._cache.pop('running_moments', None)
+      return _AlignedRuns.build(self._dataframes)
+
+    return self._cached('aligned', _build)
+
+  def _running_moments(self) -> Optional[_RunningMoments]:
+    """The running mean and std of runs, memoized until the runs change as
+    in _cached(), or None where the aligned array should be used instead.
+
+    The moments exist only after rows are appended to the runs since the last
+    aggregation: the previous moments (or those derived from the previous
+    aligned array) are fed only with the new rows, if the rows fed before
+    remain the same. Otherwise, e.g. at the first aggregation or when the
+    runs have been replaced, None.
+    """
+
+    def _update() -> Optional[_RunningMoments]:
+      moments, self._moments = self._moments, None
+      seed, self._moments_seed = self._moments_seed, None
+      if moments is None and seed is not None:
+        moments = _RunningMoments.from_aligned(*seed)
+      if moments is not None and moments.update(self._dataframes):
+        return moments
+      return None
+
+    self._moments = self._cached('running_moments', _update)
+    return self._moments
+
+  def _aggregate(self,
+                 method: str,
+                 *args,
+                 numeric_only=True,
+                 columns: Optional[Sequence[str]] = None,
+                 x_column: Optional[str] = None,
+                 **kwargs):
+    """Compute `self.grouped.<method>(...)`, using the (cached) aligned array
+    of runs, or the running moments after rows are appended to the runs,
+    instead of pandas groupby whenever possible.
+
+    If `columns` is given, only these columns (and `x_column`, if any) are
+    aligned and aggregated, over the steps where any of `columns` has a value.
+    This avoids the union of all the steps, when tags are logged at very
+    different frequencies.
+    """
+    if not args and not kwargs and numeric_only is True:
+      if columns is None and method in ('mean', 'std'):
+        moments = self._running_moments()
+        if moments is not None:
+          return moments.reduce(method)
+
+    if columns is None:
+      aligned = self._aligned
+    else:
+      columns = tuple(columns)
+      aligned = self._cached(
+          ('aligned', columns, x_column),
+          lambda: _AlignedRuns.build(self._select_columns(columns, x_column)))
+
+    if not args and not kwargs and numeric_only is True:
+      if aligned is not None:
+        return aligned.reduce(method)
+    dfs = (self._dataframes
+           if columns is None else self._select_columns(columns, x_column))
+    has_sparse = any(
+        isinstance(dtype, pd.SparseDtype) for df in dfs for dtype in df.dtypes)
+    if has_sparse:
+      # Reduced to numpy dtypes as in _AlignedRuns, rather than sparse ones
+      # (or not implemented, e.g. std), regardless of how runs are aligned.
+      dfs = [_dense_dataframe(df) for df in dfs]
+    if columns is None and not has_sparse:
+      g = self.grouped
+    else:
+      g = pd.concat(dfs, sort=False).groupby(level=0)
+    return getattr(g, method)(*args, numeric_only=numeric_only, **kwargs)
+
+  def _select_columns(
+      self,
+      columns: Sequence[str],
+      x_column: Optional[str] = None,
+  ) -> List[pd.DataFrame]:
+    """The dataframes of runs with the given columns only (if exist), without
+    the rows (steps) where none of `columns` has a value."""
+    dfs = []
+    for df in self._dataframes:
+      subset = [c for c in columns if c in df.columns and c != x_column]
+      df = df[[*subset, x_column] if x_column in df.columns else subset]
+      dfs.append(df.dropna(how='all', subset=subset))
+    return dfs
+
+  def _reduced(self, method: str) -> pd.DataFrame:
+    """The (cached) result of e.g. `self.mean()`; should not be modified."""
+    return self._cached('reduced_' + method, lambda: self._aggregate(method))
+
   @property
   def columns(self) -> Iterable[str]:
     return util.merge_list(*[df.columns for df in self._dataframes])
@@ -687,21 +1489,50 @@ class Hypothesis(Iterable[Run]):
   def rolling(self, *args, **kwargs):
     return self.grouped.rolling(*args, **kwargs)
 
-  def mean(self, *args, numeric_only=True, **kwargs) -> pd.DataFrame:
-    g = self.grouped
-    return g.mean(*args, numeric_only=numeric_only, **kwargs)
-
-  def std(self, *args, numeric_only=True, **kwargs) -> pd.DataFrame:
-    g = self.grouped
-    return g.std(*args, numeric_only=numeric_only, **kwargs)
-
-  def min(self, *args, numeric_only=True, **kwargs) -> pd.DataFrame:
-    g = self.grouped
-    return g.min(*args, numeric_only=numeric_only, **kwargs)
-
-  def max(self, *args, numeric_only=True, **kwargs) -> pd.DataFrame:
-    g = self.grouped
-    return g.max(*args, numeric_only=numeric_only, **kwargs)
+  def mean(self,
+           *args,
+           numeric_only=True,
+           columns: Optional[Sequence[str]] = None,
+           x_column: Optional[str] = None,
+           **kwargs) -> pd.DataFrame:
+    """Same as `self.grouped.mean(...)`; see `grouped` for memoization.
+
+    If `columns` is given, only these columns (and `x_column`, if any) are
+    aggregated, over the steps where any of `columns` has a value. This is
+    useful for tags logged at a lower frequency than others.
+    """
+    return self._aggregate('mean', *args, numeric_only=numeric_only,
+                           columns=columns, x_column=x_column, **kwargs)
+
+  def std(self,
+          *args,
+          numeric_only=True,
+          columns: Optional[Sequence[str]] = None,
+          x_column: Optional[str] = None,
+          **kwargs) -> pd.DataFrame:
+    """Same as `self.grouped.std(...)`; see mean() for `columns`."""
+    return self._aggregate('std', *args, numeric_only=numeric_only,
+                           columns=columns, x_column=x_column, **kwargs)
+
+  def min(self,
+          *args,
+          numeric_only=True,
+          columns: Optional[Sequence[str]] = None,
+          x_column: Optional[str] = None,
+          **kwargs) -> pd.DataFrame:
+    """Same as `self.grouped.min(...)`; see mean() for `columns`."""
+    return self._aggregate('min', *args, numeric_only=numeric_only,
+                           columns=columns, x_column=x_column, **kwargs)
+
+  def max(self,
+          *args,
+          numeric_only=True,
+          columns: Optional[Sequence[str]] = None,
+          x_column: Optional[str] = None,
+          **kwargs) -> pd.DataFrame:
+    """Same as `self.grouped.max(...)`; see mean() for `columns`."""
+    return self._aggregate('max', *args, numeric_only=numeric_only,
+                           columns=columns, x_column=x_column, **kwargs)
 
   def resample(self,
                x_column: Optional[str] = None,
@@ -762,34 +1593,18 @@ class Hypothesis(Iterable[Run]):
       if x_column is not None:
         df = df.set_index(x_column)  # type: ignore
 
-      # yapf: disable
-      def _interpolate_if_numeric(y_series: pd.Series):
-        if y_series.dtype.kind in ('i', 'f'):
-          # y_series might contain NaN values, but interp1d does not
-          # properly deal with nan. So we filter both of x and y series.
-          idx_valid = ~np.isnan(y_series)
-          if idx_valid.sum() >= 2:
-            return scipy.interpolate.interp1d(df.index[idx_valid],
-                                              y_series[idx_valid],
-                                              bounds_error=False,
-                                              fill_value="extrapolate")(x_samples)
-          else:
-            # Insufficient data due to a empty/crashed run.
-            # Ignore the corner case! TODO: Add warning message.
-            return pd.Series(np.full_like(x_samples, np.nan, dtype=float))
-        else:
-          # maybe impossible to interpolate (i.e. object): skip it.
-          # This column will be filtered out.
-          assert False, "should have been dropped earlier"
-      # yapf: enable
-
-      # filter out non-numeric columns.
-      df_interp = df.select_dtypes(['number'])
-      df_interp = cast(pd.DataFrame, df_interp.apply(_interpolate_if_numeric))
+      # filter out non-numeric columns. Note that the index column, which
+      # may be duplicated as a column, will be replaced by the samples.
+      df_numeric = df.select_dtypes(['number'])
+      if index_name in df_numeric.columns:
+        df_numeric = df_numeric.drop(columns=index_name)
+      y_samples = _interpolate_linear(
+          np.asarray(df_numeric.index, dtype=float),
+          df_numeric.to_numpy(dtype=float), x_samples)
 
-      df_interp[index_name] = x_samples
-      df_interp.set_index(index_name, inplace=True)
-      return df_interp
+      return pd.DataFrame(y_samples,
+                          columns=df_numeric.columns,
+                          index=pd.Index(x_samples, name=index_name))
 
     def _process_df_subsample(df: pd.DataFrame) -> pd.DataFrame:
       if n_samples <= df.shape[0]:
@@ -803,26 +1618,71 @@ class Hypothesis(Iterable[Run]):
       processed_dfs = [_process_df_subsample(df) for df in self._dataframes]
 
     assert len(processed_dfs) == len(self.runs)
-    return Hypothesis(
+    return Hypothesis._trusted(
         name=self.name,
-        runs=[
+        runs=RunList._trusted([
             Run(r.path, df_new) for (r, df_new) in zip(self.runs, processed_dfs)
-        ],
+        ]),
         config=copy.copy(self.config),
     )
 
-  def apply(self, fn: Callable[[pd.DataFrame], pd.DataFrame]) -> Hypothesis:
+  def apply(
+      self,
+      fn: Callable[[pd.DataFrame], pd.DataFrame],
+      *,
+      n_jobs: int = 1,
+      executor: Optional[concurrent.futures.Executor] = None,
+  ) -> Hypothesis:
     """Apply a transformation on all underlying DataFrames.
 
     This returns a copy of Hypothesis and children Run objects.
+    The runs can be processed in parallel with `n_jobs` or `executor`;
+    see util.map_parallel().
     """
-    return Hypothesis(
+    dfs = util.map_parallel(fn, [r.df for r in self.runs],
+                            n_jobs=n_jobs, executor=executor)
+    return Hypothesis._trusted(
         name=self.name,
-        runs=[Run(r.path, fn(r.df)) for r in self.runs],
+        runs=RunList._trusted(
+            [Run(r.path, df) for r, df in zip(self.runs, dfs)]),
         config=copy.copy(self.config),
     )
 
 
+@dataclasses.dataclass(frozen=True)
+class _AggregateMeanLast:
+  """Aggregate a series by the average of its last `portion` of values
+  (at least one). See Experiment.AGGREGATE_MEAN_LAST."""
+  portion: float
+
+  def __call__(self, series: pd.Series) -> float:
+    window = max(1, int(len(series) * self.portion))
+    return series.rolling(window).mean().iloc[-1]
+
+  def aggregate_frame(self, df: pd.DataFrame) -> Dict[Hashable, float]:
+    """Aggregate all the numeric columns of `df` at once, each over its
+    non-NaN values (i.e. `self(df[column].dropna())` for each column)."""
+    if not df.columns.is_unique:
+      return {}
+    positions = [
+        j for j, dtype in enumerate(df.dtypes)
+        if isinstance(dtype, np.dtype) and dtype.kind in 'iuf'
+    ]
+    columns = df.columns[positions]
+    values = df.iloc[:, positions].to_numpy(dtype=float)
+
+    valid = ~np.isnan(values)
+    counts = valid.sum(axis=0)
+    window = np.maximum(1, (counts * self.portion).astype(int))
+    # The number of non-NaN values at or after each row.
+    remaining = np.cumsum(valid[::-1], axis=0)[::-1]
+    selected = valid & (remaining <= window)
+    with np.errstate(invalid='ignore', divide='ignore'):
+      means = np.where(selected, values, 0).sum(axis=0) / np.where(
+          counts > 0, window, np.nan)
+    return dict(zip(columns, means))
+
+
 class Experiment(Iterable[Hypothesis]):
   """An Experiment is a collection of Hypotheses with config structure."""
 
@@ -841,6 +1701,11 @@ class Experiment(Iterable[Hypothesis]):
       name: The name.
       hypotheses: A collection of hypotheses to initialize with.
     """
+    self._init(name, hypotheses, config_keys=config_keys,
+               summary_columns=summary_columns)
+
+  def _init(self, name, hypotheses, *, config_keys, summary_columns) -> None:
+    """Initialize fields; the common part of __init__() and _trusted()."""
     self._name = name if name is not None else ""
     self._hypotheses: Dict[str, Hypothesis] = collections.OrderedDict()
 
@@ -852,6 +1717,7 @@ class Experiment(Iterable[Hypothesis]):
       summary_columns = [summary_columns]
     self._summary_columns = tuple(summary_columns) \
       if summary_columns is not None else None
+    self._cache: Dict[str, Any] = {}
 
     # The internal pd.DataFrame representation that backs Experiment.
     # index   = [*config_keys, name: str]  (a MultiIndex)
@@ -861,10 +1727,29 @@ class Experiment(Iterable[Hypothesis]):
       hypotheses = list(hypotheses)
 
     for h in hypotheses:
-      self.add_hypothesis(h, extend_if_conflict=False)
+      self._add_hypothesis(h, extend_if_conflict=False)
+
+  @classmethod
+  def _trusted(
+      cls,
+      name: Optional[str] = None,
+      hypotheses: Iterable[Hypothesis] = (),
+      *,
+      config_keys: Optional[Sequence[str]] = None,
+      summary_columns: Optional[Sequence[str]] = None,
+  ) -> Experiment:
+    """Create an Experiment without the runtime type checks of __init__().
+
+    For internal use only, where the arguments are known to be valid, e.g.
+    rebuilding an experiment from existing (or transformed) hypotheses.
+    """
+    ex = cls.__new__(cls)
+    ex._init(name, hypotheses, config_keys=config_keys,
+             summary_columns=summary_columns)
+    return ex
 
   def _replace(self, **kwargs) -> Experiment:
-    ex = Experiment(
+    ex = Experiment._trusted(
         name=kwargs.pop('name', self._name),
         hypotheses=list(self._hypotheses.values()),
         config_keys=kwargs.pop('config_keys', self._config_keys),
@@ -876,39 +1761,43 @@ class Experiment(Iterable[Hypothesis]):
 
   @property
   def _df(self) -> pd.DataFrame:
+    df = self._index_frame()
+    summary_columns = self._summary_columns \
+      if self._summary_columns is not None else self.columns
+
+    # One (memoized) summary per hypothesis, for all the columns.
+    summaries = [h.summary(columns=summary_columns) for h in df['hypothesis']]
+    return pd.concat([
+        df,
+        pd.DataFrame({
+            k: [summary.loc[0, k] for summary in summaries]
+            for k in summary_columns
+        }, index=df.index),
+    ], axis=1)  # yapf: disable
+
+  def _index_frame(self) -> pd.DataFrame:
+    """The index of _df (config keys and name) with the hypothesis column but
+    without any summary, which is cached until hypotheses or configs change.
+    """
     hypotheses: List[Hypothesis] = list(self._hypotheses.values())
-
-    df = pd.DataFrame({
-        'name': [h.name for h in hypotheses],
-        'hypothesis': hypotheses,
-        **{  # config keys (will be index)
-            k: [(h.config or {}).get(k) for h in hypotheses]
-            for k in self._config_keys
-        },
-    })
-
-    def _append_summary(summary_columns):
-      nonlocal df
-      df = pd.concat([
-          df,
-          pd.DataFrame({
-              k: [
-                  # TODO: h.summary is expensive and slow, cache it
-                  h.summary(columns=summary_columns).loc[0, k]
-                  for h in self._hypotheses.values()
-              ] for k in summary_columns
-          }),
-      ], axis=1)  # yapf: disable
-
-    if self._summary_columns is not None:
-      _append_summary(summary_columns=self._summary_columns)
-    else:
-      _append_summary(summary_columns=self.columns)
-
-    # Need to sort index w.r.t the multi-index level hierarchy, because
-    # the order of hypotheses being added is not guaranteed
-    df = df.set_index([*self._config_keys, 'name']).sort_index()
-    return df
+    signature = (tuple(self._config_keys),
+                 tuple((id(h), h.name, id(h.config)) for h in hypotheses))
+    cached = self._cache.get('index_frame', None)
+    if cached is None or cached[0] != signature:
+      df = pd.DataFrame({
+          'name': [h.name for h in hypotheses],
+          'hypothesis': hypotheses,
+          **{
+              k: [(h.config or {}).get(k) for h in hypotheses]
+              for k in self._config_keys
+          },
+      })
+      # Need to sort index w.r.t the multi-index level hierarchy, because
+      # the order of hypotheses being added is not guaranteed
+      df = df.set_index([*self._config_keys, 'name']).sort_index()
+      cached = (signature, df)
+      self._cache['index_frame'] = cached
+    return cached[1]
 
   @classmethod
   def from_runs(
@@ -920,34 +1809,52 @@ class Experiment(Iterable[Hypothesis]):
       summary_columns: Optional[Sequence[str]] = None,
       name: Optional[str] = None,
   ) -> Experiment:
-    """Construct a new Experiment object directly from a RunList."""
+    """Construct a new Experiment object directly from a RunList.
+
+    Summaries of hypotheses are not computed here, but lazily on first use
+    (e.g. select(), summary(), or when displayed).
+    """
 
     df = runs.to_dataframe(
         include_config=True,
         config_fn=config_fn,
         index_keys=config_keys,
         as_hypothesis=True,
-        include_summary=True,
+        include_summary=False,
         hypothesis_namer=None,  # TODO use more general hypothesis_factory.
     )
+    hypotheses: List[Hypothesis] = list(df['hypothesis'])
+
+    def _summary_keys(h: Hypothesis) -> List[str]:
+      # The columns of h.summary(), which can be known without computing it.
+      index_names = set(run_df.index.name for run_df in h._dataframes)
+      index_name = index_names.pop() \
+        if len(index_names) == 1 and not h.empty() else None
+      return [index_name or 'index', *h.columns]
 
+    available_columns = util.merge_list(*map(_summary_keys, hypotheses))
     if summary_columns:
-      try:
-        df = df[['hypothesis', *summary_columns]]
-      except KeyError:
+      missing_cols = [
+          col for col in summary_columns if col not in available_columns
+      ]
+      if missing_cols:
         # summary_columns often have many mistakes or missing keys,
         # so let the error message more informative.
-        missing_cols = [col for col in summary_columns if col not in df.keys()]
+        keys = ['hypothesis', *available_columns]
         suggestions = [
-            difflib.get_close_matches(col, df.keys()) for col in missing_cols
+            difflib.get_close_matches(col, keys) for col in missing_cols
         ]
         linesep = '\n'
         raise KeyError(
             f"Some columns do not exist in the dataframe: {missing_cols}. "
             f"Close matches = {linesep.join(str(s) for s in suggestions)}"
         ) from None
+    else:
+      summary_columns = available_columns
 
-    return cls.from_dataframe(cast(pd.DataFrame, df), name=name)
+    ex = cls.from_dataframe(cast(pd.DataFrame, df), name=name)
+    ex._summary_columns = tuple(sorted(set(summary_columns))) or None
+    return ex
 
   @classmethod
   def from_dataframe(
@@ -1008,7 +1915,7 @@ class Experiment(Iterable[Hypothesis]):
     summary_columns = list(sorted(
         set(df.columns).difference([run_column, 'hypothesis', *_aslist(by)])
     ))  # yapf: disable
-    ex = Experiment(
+    ex = Experiment._trusted(
         name=name,
         config_keys=config_keys,
         summary_columns=summary_columns if summary_columns else None)
@@ -1019,12 +1926,12 @@ class Experiment(Iterable[Hypothesis]):
       hypotheses = list(df['hypothesis'])
       if not hypotheses:
         raise ValueError("The dataframe contains no Hypotheses, seems empty.")
-      if not isinstance(hypotheses[0], Hypothesis):
+      if not all(isinstance(h, Hypothesis) for h in hypotheses):
         raise ValueError("The column 'hypothesis' does not contain "
                          "a Hypothesis object.")
       for h in hypotheses:
         # TODO test this behavior on h_namer
-        ex.add_hypothesis(h)
+        ex._add_hypothesis(h)
 
     else:
       if hypothesis_namer is None:
@@ -1040,8 +1947,7 @@ class Experiment(Iterable[Hypothesis]):
           hypothesis_key = dict(zip(cast(List[str], by), hypothesis_key))
         runs = RunList(runs_df[run_column])
         hypothesis_name = hypothesis_namer(hypothesis_key, runs)
-        h = runs.to_hypothesis(name=hypothesis_name)
-        ex.add_hypothesis(h)
+        ex._add_hypothesis(Hypothesis._trusted(hypothesis_name, runs))
 
     return ex
 
@@ -1075,6 +1981,14 @@ class Experiment(Iterable[Hypothesis]):
       *,
       extend_if_conflict=False,
   ) -> Hypothesis:
+    return self._add_hypothesis(h, extend_if_conflict=extend_if_conflict)
+
+  def _add_hypothesis(
+      self,
+      h: Hypothesis,
+      *,
+      extend_if_conflict=False,
+  ) -> Hypothesis:
 
     if h.name in self._hypotheses:
       if not extend_if_conflict:
@@ -1096,6 +2010,7 @@ class Experiment(Iterable[Hypothesis]):
       d.runs.extend(h.runs)
     else:
       self._hypotheses[h.name] = h  # add into the collection.
+      self._cache.pop('hypothesis_array', None)
 
     return self._hypotheses[h.name]
 
@@ -1120,6 +2035,9 @@ class Experiment(Iterable[Hypothesis]):
       key,
       k=None,
       descending=True,
+      *,
+      n_jobs: int = 1,
+      executor: Optional[concurrent.futures.Executor] = None,
   ) -> Hypothesis | Sequence[Hypothesis]:
     """Choose a hypothesis that has the largest value on the specified column.
 
@@ -1129,6 +2047,9 @@ class Experiment(Iterable[Hypothesis]):
         top-k hypotheses will be returned as a tuple.
       descending: If True, the hypothesis with largest value in key will be
         chosen. If False, the hypothesis with smallest value will be chosen.
+        Ties are broken by the order of hypotheses, and NaN comes last.
+      n_jobs, executor: The key can be evaluated for the hypotheses in
+        parallel; see util.map_parallel().
 
     Returns: the top-1 hypothesis (if `k` is None) or a tuple of k hypotheses
       in the order specified by `key`.
@@ -1142,31 +2063,57 @@ class Experiment(Iterable[Hypothesis]):
     if isinstance(key, str):
       y = str(key)  # make a copy for closure
       if descending:
-        key = lambda h: h.mean()[y].max()
+        key = lambda h: h._reduced('mean')[y].max()
       else:
-        key = lambda h: h.mean()[y].min()
+        key = lambda h: h._reduced('mean')[y].min()
     elif callable(key):
       pass  # key: Hypothesis -> scalar.
     else:
       raise TypeError(
           f"`key` must be a str or a callable, but got: {type(key)}")
 
-    candidates = sorted(self.hypotheses, key=key, reverse=descending)
-    assert isinstance(candidates, list)
+    hypotheses = self.hypotheses
+    values = util.map_parallel(key, hypotheses, n_jobs=n_jobs,
+                               executor=executor)
+    scores = np.asarray(values)
+    if scores.ndim != 1 or scores.dtype.kind not in 'biuf' or not len(scores):
+      # Not a number (e.g. tuple), so fall back to the generic sort.
+      candidates = [
+          h for _, h in sorted(zip(values, hypotheses),
+                               key=lambda t: t[0], reverse=descending)
+      ]
+      return candidates[0] if k is None else candidates[:k]
+
+    # Partial selection of the k smallest (of negated scores if descending):
+    # all the ties of the k-th value are sorted stably, i.e. by position.
+    scores = scores.astype(float)
+    scores = -scores if descending else scores
+    scores[np.isnan(scores)] = np.inf
+    n = 1 if k is None else k
+    kth = np.partition(scores, n - 1)[n - 1]
+    candidates = np.flatnonzero(scores <= kth)
+    top = candidates[np.argsort(scores[candidates], kind='stable')][:n]
     if k is None:
-      return candidates[0]
+      return hypotheses[top[0]]
     else:
-      return candidates[:k]
+      return [hypotheses[i] for i in top]
 
   def select(self, expr: str | Callable[[Hypothesis], bool]) -> Experiment:
-    """Select a subset of Hypothesis matching the given criteria."""
+    """Select a subset of Hypothesis matching the given criteria.
+
+    The returned Experiment is a view that shares the Hypothesis objects.
+    A query on config keys or names does not need to compute summaries.
+    """
 
     if isinstance(expr, str):
-      df = self._df.query(expr)
+      try:
+        df = self._index_frame().query(expr)
+      except NameError:  # e.g. referring to a summary column
+        df = self._df.query(expr)
       name = self.name + "[" + expr + "]"
 
     elif callable(expr):  # Hypothesis -> bool
-      df = self._df
+      df = self._index_frame()
       mask = df['hypothesis'].apply(expr)
       if mask.dtype != bool:
         raise TypeError("The filter function must return bool, but unexpected "
@@ -1178,7 +2125,12 @@ class Experiment(Iterable[Hypothesis]):
       raise TypeError(  # ...
           "`expr` must be a str or Callable, but given {}".format(type(expr)))
 
-    return Experiment.from_dataframe(df, name=name)
+    return Experiment._trusted(
+        name=name,
+        hypotheses=df['hypothesis'],
+        config_keys=self._config_keys,
+        summary_columns=self._summary_columns,
+    )
 
   def __iter__(self) -> Iterator[Hypothesis]:
     return iter(self._hypotheses.values())
@@ -1274,14 +2226,12 @@ class Experiment(Iterable[Hypothesis]):
     if isinstance(key, str):
       name = key
       return self._hypotheses[name]
-    elif isinstance(key, int):
-      try:
-        _keys = self._hypotheses.keys()
-        name = next(itertools.islice(_keys, key, None))
-      except StopIteration:
+    elif isinstance(key, (int, np.integer)):
+      hypotheses = self._hypothesis_array
+      if not -len(hypotheses) <= key < len(hypotheses):
         raise IndexError("out of range: {} (should be < {})".format(
-            key, len(self._hypotheses)))
-      return self._hypotheses[name]
+            key, len(hypotheses)))
+      return hypotheses[key]
     elif isinstance(key, tuple):
       hypo_key, column = key
       hypos = self[hypo_key]
@@ -1290,24 +2240,39 @@ class Experiment(Iterable[Hypothesis]):
       return hypos[column]  # type: ignore
     elif isinstance(key, Iterable):
       key = list(key)  # type: ignore
-      if all(isinstance(k, bool) for k in key):
+      hypotheses = self._hypothesis_array
+      if all(isinstance(k, (bool, np.bool_)) for k in key):
         # fancy indexing through bool
-        if len(key) != len(self._hypotheses):
+        if len(key) != len(hypotheses):
           raise IndexError("boolean index did not match indexed array along"
                            " dimension 0; dimension is {} but corresponding "
                            " boolean dimension is {}".format(
-                               len(self._hypotheses), len(key)))
-        r = np.empty(len(key), dtype=object)
-        r[:] = list(self._hypotheses.values())
-        return r[key]
+                               len(hypotheses), len(key)))
+        return hypotheses[np.asarray(key, dtype=bool)]
+      elif all(isinstance(k, (int, np.integer)) for k in key):
+        # fancy indexing through int
+        return list(hypotheses[np.asarray(key, dtype=np.intp)])
       else:
-        # fancy indexing through int?  # TODO: support str
-        hypo_keys = list(self._hypotheses.keys())
-        to_key = lambda k: k if isinstance(k, str) else hypo_keys[k]
-      return [self._hypotheses[to_key(k)] for k in key]  # type: ignore
+        # fancy indexing through int or str (name)
+        return [
+            self._hypotheses[k] if isinstance(k, str) else hypotheses[k]
+            for k in key
+        ]
     else:
       raise ValueError("Unsupported index: {}".format(key))
 
+  @property
+  def _hypothesis_array(self) -> np.ndarray:
+    """All the hypotheses as an object array, for positional indexing.
+    This is cached until a new hypothesis is added."""
+    hypotheses = self._cache.get('hypothesis_array', None)
+    if hypotheses is None:
+      hypotheses = np.empty(len(self._hypotheses), dtype=object)
+      for i, h in enumerate(self._hypotheses.values()):
+        hypotheses[i] = h
+      self._cache['hypothesis_array'] = hypotheses
+    return hypotheses
+
   @property
   def columns(self) -> Sequence[str]:
     # merge and uniquify all columns but preserving the order.
@@ -1315,8 +2280,7 @@ class Experiment(Iterable[Hypothesis]):
 
   @staticmethod
   def AGGREGATE_MEAN_LAST(portion: float):
-    return (lambda series: series.rolling(max(1, int(len(series) * portion))
-                                          ).mean().iloc[-1])  # yapf: disable
+    return _AggregateMeanLast(portion)
 
   def summary(
       self,
@@ -1380,10 +2344,11 @@ class Experiment(Iterable[Hypothesis]):
         or 'index')  # yapf: disable  # noqa: W503
 
     if columns is None:
-      if index_name not in self.columns:
-        columns = [index_name] + list(self.columns)
+      all_columns = list(self.columns)
+      if index_name not in all_columns:
+        columns = [index_name] + all_columns
       else:
-        columns = list(self.columns)
+        columns = all_columns
     else:
       columns = list(columns)
 
@@ -1412,11 +2377,21 @@ class Experiment(Iterable[Hypothesis]):
         v = aggregate_fn(series) if column != index_name else series.max()
         return v
 
+      def aggregate_row(i: int, hm: pd.DataFrame):
+        if column != index_name and column in aggregated_rows[i]:
+          return aggregated_rows[i][column]
+        return aggregate_h(df_series(hm))
+
       return pd.Series(
           name=column,
-          data=[aggregate_h(df_series(hm)) for hm in rows],
+          data=[aggregate_row(i, hm) for i, hm in enumerate(rows)],
       )
 
+    # The default aggregation is computed for all numeric columns at once.
+    aggregated_rows: List[Dict[Hashable, float]] = [{} for _ in rows]
+    if isinstance(aggregate, _AggregateMeanLast):
+      aggregated_rows = [aggregate.aggregate_frame(hm) for hm in rows]
+
     df = pd.concat(
         [df] +  # ... index and hypothesis
         [make_summary_series(column) for column in columns],
@@ -1461,47 +2436,75 @@ class Experiment(Iterable[Hypothesis]):
 
     return self._replace(config_keys=new_config_keys)
 
-  def resample(self, *, n_samples: int) -> Experiment:
+  def resample(
+      self,
+      *,
+      n_samples: int,
+      n_jobs: int = 1,
+      executor: Optional[concurrent.futures.Executor] = None,
+  ) -> Experiment:
     """Resample data uniformly (equidistantly) for each of the hypotheses,
     and return a copy of new Experiment objet.
 
+    The hypotheses can be processed in parallel with `n_jobs` or `executor`;
+    see util.map_parallel().
+
     See: Hypothesis.resample().
     """
-    return Experiment(
+    return Experiment._trusted(
         name=self.name,
-        hypotheses=[h.resample(n_samples=n_samples) for h in self.hypotheses],
+        hypotheses=util.map_parallel(
+            functools.partial(Hypothesis.resample, n_samples=n_samples),
+            self.hypotheses, n_jobs=n_jobs, executor=executor),
         config_keys=self._config_keys,
         summary_columns=self._summary_columns,
     )
 
-  def interpolate(self,
-                  x_column: Optional[str] = None,
-                  *,
-                  n_samples: int) -> Experiment:
+  def interpolate(
+      self,
+      x_column: Optional[str] = None,
+      *,
+      n_samples: int,
+      n_jobs: int = 1,
+      executor: Optional[concurrent.futures.Executor] = None,
+  ) -> Experiment:
     """Apply resampling and interpolation to each of the hypothesis,
     and return a copy of new Experiment (with its children Hypothesis/Run)
     object.
 
+    The hypotheses can be processed in parallel with `n_jobs` or `executor`;
+    see util.map_parallel().
+
     See: Hypothesis.interpolate().
     """
-    return Experiment(
+    return Experiment._trusted(
         name=self.name,
-        hypotheses=[
-            h.interpolate(x_column, n_samples=n_samples)
-            for h in self.hypotheses
-        ],
+        hypotheses=util.map_parallel(
+            functools.partial(Hypothesis.interpolate, x_column=x_column,
+                              n_samples=n_samples),
+            self.hypotheses, n_jobs=n_jobs, executor=executor),
         config_keys=self._config_keys,
         summary_columns=self._summary_columns,
     )
 
-  def apply(self, fn: Callable[[pd.DataFrame], pd.DataFrame]) -> Experiment:
+  def apply(
+      self,
+      fn: Callable[[pd.DataFrame], pd.DataFrame],
+      *,
+      n_jobs: int = 1,
+      executor: Optional[concurrent.futures.Executor] = None,
+  ) -> Experiment:
     """Apply a transformation on all underlying DataFrames.
 
     This returns a copy of Experiment and children Hypothesis objects.
+    The hypotheses can be processed in parallel with `n_jobs` or `executor`;
+    see util.map_parallel().
     """
-    return Experiment(
+    return Experiment._trusted(
         name=self.name,
-        hypotheses=[h.apply(fn) for h in self.hypotheses],
+        hypotheses=util.map_parallel(
+            functools.partial(Hypothesis.apply, fn=fn),
+            self.hypotheses, n_jobs=n_jobs, executor=executor),
         config_keys=self._config_keys,
         summary_columns=self._summary_columns,
     )
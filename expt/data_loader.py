@@ -14,12 +14,14 @@ import multiprocessing.pool
 import os
 import pathlib
 from pathlib import Path
+import struct
 import sys
 import tempfile
-from typing import (Any, Callable, Dict, Generic, Iterator, List, Mapping,
-                    NamedTuple, Optional, Sequence, Tuple, Type, TYPE_CHECKING,
-                    TypeVar, Union)
+from typing import (Any, BinaryIO, Callable, Dict, Generic, Iterator, List,
+                    Mapping, NamedTuple, Optional, Sequence, Tuple, Type,
+                    TYPE_CHECKING, TypeVar, Union)
 from typing_extensions import get_args  # python 3.7 support
+from typing_extensions import Literal
 from typing_extensions import Protocol
 
 import multiprocess.pool
@@ -172,8 +174,10 @@ class CSVLogReader(LogReader[pd.DataFrame]):
       print(f"CSVLogReader: Reading {self._csv_path}",
             file=sys.stderr, flush=True)  # yapf: disable
 
+    # Remote files are read through the local-disk cache, so that
+    # reading an unchanged file again costs only a stat call.
     df: pd.DataFrame
-    with path_util.open(self._csv_path, mode='r') as f:
+    with path_util.open_cached(self._csv_path, mode='r') as f:
       df = pd.read_csv(f)  # type: ignore
 
     return df
@@ -184,6 +188,48 @@ class CSVLogReader(LogReader[pd.DataFrame]):
     return df
 
 
+def iter_tfrecords(fp: BinaryIO,
+                   *,
+                   buffer_size: int = 1 << 20) -> Iterator[bytes]:
+  """Iterate over the records of a TFRecord file (e.g., tensorboard event
+  files) from a binary stream, such as one returned by path_util.open().
+
+  The stream is read in large chunks of `buffer_size` bytes, so that records
+  can be decoded while the rest of the (remote) file is still in transfer.
+  Each record is framed as follows (CRCs are not verified):
+
+      uint64 length, uint32 masked_crc32c(length),
+      byte   data[length], uint32 masked_crc32c(data)
+
+  A truncated record at the end of the stream (e.g., the file is still being
+  written) is ignored.
+  """
+  HEADER_SIZE, FOOTER_SIZE = 12, 4
+
+  buf = bytearray()
+  pos = 0  # the offset of the next record in buf
+
+  def _fill(size: int) -> bool:
+    """Ensure at least `size` bytes are available in buf[pos:]."""
+    nonlocal buf, pos
+    while len(buf) - pos < size:
+      chunk = fp.read(max(buffer_size, size - (len(buf) - pos)))
+      if not chunk:
+        return False  # EOF
+      del buf[:pos]
+      pos = 0
+      buf += chunk
+    return True
+
+  while _fill(HEADER_SIZE):
+    (length,) = struct.unpack_from('<Q', buf, pos)
+    if not _fill(HEADER_SIZE + length + FOOTER_SIZE):
+      break
+    start = pos + HEADER_SIZE
+    yield bytes(buf[start:start + length])
+    pos = start + length + FOOTER_SIZE
+
+
 if tensorboard or TYPE_CHECKING:
   from tensorboard.backend.event_processing import event_file_loader
 
@@ -193,32 +239,38 @@ if tensorboard or TYPE_CHECKING:
     This supports other protocols such as sftp:// like expt.path_util do;
     tensorboard's event file loader supports local and gcs:// paths only.
 
-    Currently, the GFile backend (PyRecordReader_New in tensorboard's TF stub
-    or the tensorflow.io core module) can support ONLY local and GCS files,
-    no way to open a file through a python IO (io.IOBase) or an unix socket.
-    The only way to read from a remote file (via SSH/SFTP) is actually to
-    download and stream the remote file into a local, temporary file
-    (for the sake of maximum throughput).
-
-    Note: .close() must be called otherwise a resource/connection will leak.
+    The GFile backend (PyRecordReader_New in tensorboard's TF stub or the
+    tensorflow.io core module) can support ONLY local and GCS files, with no
+    way to read through a python IO (io.IOBase). For other remote files
+    (e.g., via SSH/SFTP or fsspec), TFRecord frames are decoded directly from
+    the stream opened by path_util (see iter_tfrecords), without downloading
+    the file into a local, temporary file.
     """
 
     def __init__(self, path: str):
-      if path_util.SFTPPathUtil.supports(path):
-        # TODO: Verbose logging of file path, etc.
-        # TODO: This is blocking in a thread. Add an asynchronous version.
-        self._tmpdir = tempfile.TemporaryDirectory(prefix="expt")
-        self._local_file = path_util.SFTPPathUtil().download_local(
-            path, self._tmpdir.name)
-        super().__init__(self._local_file)
+      backend = path_util.get_backend(path)
+      if not isinstance(backend,
+                        (path_util.LocalPathUtil, path_util.GCloudPathUtil)):
+        self._remote_path: Optional[str] = path
       else:
-        self._tmpdir = None
+        self._remote_path = None
         super().__init__(path)
 
+    def Load(self):
+      if self._remote_path is None:
+        yield from super().Load()
+        return
+
+      from tensorboard.compat.proto import event_pb2  # type: ignore
+      # TODO: Verbose logging of file path, etc.
+      with path_util.open(self._remote_path, mode='rb') as f:
+        if hasattr(f, 'prefetch'):  # paramiko: pipeline the remote reads
+          f.prefetch()
+        for record in iter_tfrecords(f):
+          yield event_pb2.Event.FromString(record)
+
     def close(self):
-      with contextlib.suppress(IOError):
-        if self._tmpdir:
-          self._tmpdir.cleanup()
+      pass  # no resources are held outside of Load().
 
 
 class TensorboardLogReader(  # ...
@@ -383,7 +435,9 @@ class RustTensorboardLogReader(LogReader[Dict]):
     if not self._eventfiles:  # no event file detected
       raise CannotHandleException(log_dir, self, "No event file detected")
 
-    self._is_remote = path_util.SFTPPathUtil.supports(self.log_dir)
+    # Remote files need to be downloaded (e.g., SFTP, fsspec).
+    self._is_remote = hasattr(path_util.get_backend(self.log_dir),
+                              'download_local')
 
   def new_context(self) -> Dict:
     return {}
@@ -405,7 +459,8 @@ class RustTensorboardLogReader(LogReader[Dict]):
 
       if verbose:
         print(f"RustTensorboardLogReader: Downloading to {tmpdir}")
-      _download_local = path_util.SFTPPathUtil().download_local
+      _download_local = getattr(path_util.get_backend(self.log_dir),
+                                'download_local')
 
       for remote_file in self._eventfiles:
         local_file = _download_local(remote_file, tmpdir=tmpdir)
@@ -531,6 +586,64 @@ def _validate_run_postprocess(run: Run):
   return run
 
 
+def _compact_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+  """Reduce the memory footprint of the dataframe of a run, without loss.
+
+  - float64 columns whose values are all exactly representable as float32
+    (e.g. scalars from tensorboard event files) are stored as float32.
+  - string columns with repeated values are stored as categorical.
+  - a float index of integral values (e.g. steps) is stored as integers.
+  """
+  index = df.index
+  if index.dtype.kind == 'f' and len(index) and not index.hasnans:
+    steps = index.to_numpy()
+    if np.array_equal(steps, np.round(steps)):
+      df = df.set_axis(index.astype(np.int64), axis=0)
+
+  astype = {}
+  for column, series in df.items():
+    if series.dtype == np.float64:
+      values = series.to_numpy()
+      with np.errstate(over='ignore'):
+        values_f32 = values.astype(np.float32)
+      if np.all((values_f32 == values) | np.isnan(values)):  # NaN as is.
+        astype[column] = np.float32
+    elif series.dtype == object:
+      is_string = pd.api.types.infer_dtype(series, skipna=True) == 'string'
+      if is_string and series.nunique() <= len(series) // 2:
+        astype[column] = 'category'
+  return df.astype(astype) if astype else df
+
+
+def _sparsify_dataframe(df: pd.DataFrame,
+                        max_density: float = 0.5) -> pd.DataFrame:
+  """Store float columns that are mostly missing (e.g. tags logged at a lower
+  frequency than others) as sparse columns, which hold only the values and
+  their positions (steps)."""
+  astype = {}
+  for column, series in df.items():
+    is_float = isinstance(series.dtype, np.dtype) and series.dtype.kind == 'f'
+    if is_float and series.notna().mean() < max_density:
+      astype[column] = pd.SparseDtype(series.dtype, np.nan)
+  return df.astype(astype) if astype else df
+
+
+def _to_arrow_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+  """Convert numeric, bool, and string columns into pyarrow-backed ones
+  (pd.ArrowDtype), where missing values (NaN) are stored as nulls."""
+  import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+  astype = {}
+  for column, series in df.items():
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in 'biuf':
+      astype[column] = pd.ArrowDtype(pa.from_numpy_dtype(dtype))
+    elif (dtype == object and
+          pd.api.types.infer_dtype(series, skipna=True) == 'string'):
+      astype[column] = pd.ArrowDtype(pa.string())
+  return df.astype(astype) if astype else df
+
+
 def iter_runs_serial(
     *path_globs,
     verbose=False,
@@ -696,13 +809,39 @@ class RunLoader:
       pool_class=multiprocess.pool.Pool,
       reader_cls: Type[LogReader] | Sequence[Type[LogReader]] | None = None,
       config_reader: ConfigReader | Sequence[ConfigReader] | None = None,
+      compact: bool = False,
+      sparse: bool = False,
+      dtype_backend: Literal['numpy', 'pyarrow'] = 'numpy',
   ):
+    """Create a RunLoader.
+
+    Args:
+      compact: If True, the dataframes of runs are stored in a compact form
+        without loss, e.g. float32 values and an integer step index, which
+        roughly halves the memory. The `global_step` column, if any, is kept
+        as well, as it can be used as the x-axis (e.g. `x='global_step'`).
+      sparse: If True, float columns that are mostly missing, e.g. tags
+        logged less frequently than others, are stored as sparse columns
+        (pd.SparseDtype) instead of being dense over the union of all steps.
+      dtype_backend: If 'pyarrow', the columns of the dataframes are backed by
+        pyarrow arrays (pd.ArrowDtype, requires pandas>=1.5 and pyarrow),
+        where missing values of sparse columns take only a bit each.
+    """
+    if dtype_backend not in ('numpy', 'pyarrow'):
+      raise ValueError(f"Unknown dtype_backend: {dtype_backend}")
+    if dtype_backend == 'pyarrow':
+      # pylint: disable-next=import-outside-toplevel,unused-import
+      import pyarrow  # noqa: F401  # Fail early if not installed.
+
     self._readers: List[LogReader] = []
     self._reader_contexts = []
 
     self._verbose = verbose
     self._progress_bar = progress_bar
     self._run_postprocess_fn = run_postprocess_fn
+    self._compact = compact
+    self._sparse = sparse
+    self._dtype_backend = dtype_backend
 
     if isinstance(reader_cls, Type):
       reader_cls = [reader_cls]
@@ -777,6 +916,9 @@ class RunLoader:
       config_reader: ConfigReader,  # pickled as well..
       context: LogReaderContext,
       run_postprocess_fn: Optional[Callable[[Run], Run]] = None,
+      compact: bool = False,
+      sparse: bool = False,
+      dtype_backend: str = 'numpy',
   ) -> Tuple[Optional[Run], LogReaderContext]:
     """The job function to be executed in a "forked" worker process."""
     try:
@@ -784,6 +926,12 @@ class RunLoader:
         # read run data
         context = reader.read(context)
         df = reader.result(context)
+        if compact:
+          df = _compact_dataframe(df)
+        if sparse:
+          df = _sparsify_dataframe(df)
+        if dtype_backend == 'pyarrow':
+          df = _to_arrow_dataframe(df)
         run = Run(path=reader.log_dir, df=df)
 
         # read config
@@ -843,7 +991,10 @@ class RunLoader:
             # Note: Serialization of context can be EXTREMELY slow
             # depending on the data type of context objects.
             args=[reader, self._config_reader, context],
-            kwds=dict(run_postprocess_fn=self._run_postprocess_fn),
+            kwds=dict(run_postprocess_fn=self._run_postprocess_fn,
+                      compact=self._compact,
+                      sparse=self._sparse,
+                      dtype_backend=self._dtype_backend),
             callback=_pbar_callback_done,
             error_callback=_pbar_callback_error,
         )
@@ -893,7 +1044,10 @@ class RunLoader:
           reader=reader,
           context=self._reader_contexts[j],
           config_reader=self._config_reader,
-          run_postprocess_fn=self._run_postprocess_fn)
+          run_postprocess_fn=self._run_postprocess_fn,
+          compact=self._compact,
+          sparse=self._sparse,
+          dtype_backend=self._dtype_backend)
       self._reader_contexts[j] = new_context
 
       # TODO: better deal with failed runs.
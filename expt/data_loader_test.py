@@ -3,6 +3,7 @@
 
 import functools
 import importlib.util
+import io
 import os
 from pathlib import Path
 import shutil
@@ -252,6 +253,64 @@ class TestGetRunsRemote:
     assert runs[1].path.rstrip('/') == self.paths["scp"].rstrip('/')
 
 
+class TestEventFileStreaming:
+  """Tests decoding TFRecord (event files) directly from file streams."""
+
+  @staticmethod
+  def _write_events(fp, n: int):
+    pytest.importorskip("tensorboard")
+    from tensorboard.compat.proto import event_pb2
+    from tensorboard.compat.proto import summary_pb2
+    from tensorboard.summary.writer.record_writer import RecordWriter
+
+    writer = RecordWriter(fp)
+    for step in range(n):
+      event = event_pb2.Event(step=step, wall_time=1.0 * step)
+      event.summary.value.append(
+          summary_pb2.Summary.Value(tag="loss", simple_value=0.5 * step))
+      writer.write(event.SerializeToString())
+
+  def test_iter_tfrecords(self):
+    buf = io.BytesIO()
+    self._write_events(buf, n=100)
+    data = buf.getvalue()
+
+    # A small buffer size would make records span across multiple chunks.
+    records = list(data_loader.iter_tfrecords(io.BytesIO(data), buffer_size=7))
+    assert len(records) == 100
+
+    from tensorboard.compat.proto import event_pb2
+    events = [event_pb2.Event.FromString(r) for r in records]
+    assert [e.step for e in events] == list(range(100))
+    assert events[3].summary.value[0].simple_value == 1.5
+
+    # A truncated record at the end (e.g., partially written) is ignored.
+    records = list(data_loader.iter_tfrecords(io.BytesIO(data[:-5])))
+    assert len(records) == 99
+    assert list(data_loader.iter_tfrecords(io.BytesIO(b''))) == []
+
+  def test_remote_event_file_loader(self, tmp_path: Path, monkeypatch):
+    """Remote event files should be decoded from path_util.open() streams."""
+    eventfile = tmp_path / "events.out.tfevents.0"
+    with open(eventfile, 'wb') as fp:
+      self._write_events(fp, n=10)
+
+    remote_path = f"sftp://expt.ssh.host/{eventfile}"
+    opened = []
+
+    def _open(path, *, mode='r'):
+      opened.append((path, mode))
+      return open(eventfile, mode)  # pylint: disable=unspecified-encoding
+
+    monkeypatch.setattr(data_loader.path_util, 'open', _open)
+    loader = data_loader.RemoteAwareEventFileLoader(remote_path)
+    events = list(loader.Load())
+    loader.close()
+
+    assert opened == [(remote_path, 'rb')]
+    assert [e.step for e in events] == list(range(10))
+
+
 class TestConfigReader:
   """Tests ConfigReader."""
 
@@ -390,6 +449,80 @@ class TestRunLoader:
     assert run.path.endswith('sample_csv')
     assert run.config == {'dummy': 'config'}
 
+  def test_run_loader_compact(self, tmp_path: Path):
+    # yapf: disable
+    df = pd.DataFrame({
+        "global_step": [0, 10, 20, 30],
+        "loss": [0.5, 0.25, np.nan, 0.125],  # exact in float32
+        "lr": [0.1, 0.1, 0.1, 0.1],  # not representable as float32
+        "phase": ["train", "train", "eval", "train"],
+    })
+    # yapf: enable
+    df.to_csv(tmp_path / "progress.csv", index=False)
+
+    runs = data_loader.RunLoader(tmp_path, n_jobs=1).get_runs()
+    runs_compact = data_loader.RunLoader(
+        tmp_path, n_jobs=1, compact=True).get_runs()
+    df_csv, df_compact = runs[0].df, runs_compact[0].df
+
+    assert df_compact['loss'].dtype == np.float32
+    assert df_compact['lr'].dtype == np.float64
+    assert isinstance(df_compact['phase'].dtype, pd.CategoricalDtype)
+    for column in df_csv.columns:
+      np.testing.assert_array_equal(df_compact[column], df_csv[column])
+
+    # The step is stored as an integer index (see TensorboardLogReader),
+    # and the `global_step` column is kept, e.g. for plot(x='global_step').
+    df = df_csv[['loss']].set_axis(
+        pd.Index([0.0, 10.0, 20.0, 30.0], name='global_step'), axis=0)
+    df['global_step'] = df.index.astype(int)
+    df_compact = data_loader._compact_dataframe(df)
+    assert list(df_compact.columns) == ['loss', 'global_step']
+    assert df_compact.index.name == 'global_step'
+    assert list(df_compact.index) == [0, 10, 20, 30]
+    assert df_compact['loss'].dtype == np.float32
+
+  def test_run_loader_sparse(self, tmp_path: Path):
+    df = pd.DataFrame({
+        "step": np.arange(100),
+        "loss": np.linspace(1.0, 0.0, 100),
+        "eval": np.where(np.arange(100) % 10 == 0, 0.5, np.nan),
+    })
+    df.to_csv(tmp_path / "progress.csv", index=False)
+
+    runs = data_loader.RunLoader(tmp_path, n_jobs=1, sparse=True).get_runs()
+    df_sparse = runs[0].df
+    assert isinstance(df_sparse['eval'].dtype, pd.SparseDtype)
+    assert df_sparse['loss'].dtype == np.float64  # dense
+    np.testing.assert_array_equal(df_sparse['eval'], df['eval'])
+
+    h = runs.to_hypothesis(name='h')
+    assert list(h._aggregate('mean', columns=['eval']).index) == \
+      list(range(0, 100, 10))
+
+  def test_run_loader_arrow(self, tmp_path: Path):
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({
+        "step": [0, 1, 2],
+        "loss": [0.5, np.nan, 0.25],
+        "phase": ["train", "eval", "train"],
+    })
+    df.to_csv(tmp_path / "progress.csv", index=False)
+
+    with pytest.raises(ValueError, match='Unknown dtype_backend'):
+      data_loader.RunLoader(tmp_path, dtype_backend='arrow')  # type: ignore
+
+    runs = data_loader.RunLoader(
+        tmp_path, n_jobs=1, dtype_backend='pyarrow').get_runs()
+    df_arrow = runs[0].df
+    for column in df.columns:
+      assert isinstance(df_arrow[column].dtype, pd.ArrowDtype)
+    assert df_arrow['loss'].isna().tolist() == [False, True, False]
+
+    h = runs.to_hypothesis(name='h')
+    assert h._aligned is not None
+    np.testing.assert_array_equal(h.mean()['loss'], [0.5, np.nan, 0.25])
+
   @pytest.mark.asyncio
   @pytest.mark.parametrize("parallel_mode", ['parallel', 'serial'])
   async def test_run_loader_async(self, parallel_mode):
@@ -94,6 +94,11 @@ class TestRun(_TestBase):
     r = Run("/tmp/some-run-with-config", df=df, config=config)
     assert r.config == config
 
+    assert r.metadata == expt.data.RunMetadata(
+        rows=4, columns=("a", "b"), index_range=(0, 3))
+    r = Run("/tmp/empty-run", df=pd.DataFrame({"a": []}))
+    assert r.metadata.rows == 0 and r.metadata.index_range is None
+
   def test_run_summary(self):
     r = Run("foo", pd.DataFrame({"y": np.arange(100)}))
     df = r.summary()
@@ -188,6 +193,14 @@ class TestRunList(_TestBase):
     assert len(runs.grep(re.compile(".*13$"))) == 1
     assert len(runs.grep("R", flags=re.IGNORECASE)) == 16
 
+    # repeated queries are cached, and the cache is invalidated on extend.
+    assert list(runs.grep("r1")) == list(runs.grep("r1"))
+    runs.extend([Run("foo/r1", pd.DataFrame()), Run("r17", pd.DataFrame())])
+    assert [r.path for r in runs.grep("r1")] == [
+        'r1', *(f'r{i}' for i in range(10, 16)), 'foo/r1', 'r17'
+    ]
+    assert [r.path for r in runs.filter("r1")] == ['r1', 'foo/r1']
+
   def test_map(self):
     runs = self._fixture()
     t = V(runs.map(lambda run: run.name))
@@ -216,6 +229,14 @@ class TestRunList(_TestBase):
         "r0", "r5", "r10", "r15"
     ]
 
+    # Groups are sorted by key, and None (NA) keys are excluded.
+    groups = list(runs.groupby(
+        lambda run: None if run.name == "r0" else int(run.name[1:]) % 3))
+    assert [k for k, _ in groups] == [0, 1, 2]
+    assert groups[0][1].runs.map(lambda run: run.name) == [
+        "r3", "r6", "r9", "r12", "r15"
+    ]
+
   def test_extract(self, runs_gridsearch: RunList):
     print(runs_gridsearch)
     df = runs_gridsearch.extract(
@@ -245,6 +266,39 @@ class TestRunList(_TestBase):
     assert 'seed' not in varied_config_keys  # excludelist
     assert varied_config_keys == ('algo', 'env_id', 'r_id')
 
+    # Nested configs are flattened.
+    def nested_config_fn(r: Run):
+      algo, env_id, seed = r.name.split('-')
+      return {'algo': algo, 'env': {'id': env_id, 'version': 1}, 'seed': seed}
+
+    assert runs.varied_config_keys(config_fn=nested_config_fn) == (
+        'algo', 'env__id')
+    df = runs.to_dataframe(config_fn=nested_config_fn)
+    assert df.index.names == ['algo', 'env__id']
+
+    # ... whose keys can be queried.
+    ex = Experiment.from_runs(runs, config_fn=nested_config_fn)
+    env_id = df.index.get_level_values('env__id')[0]
+    ex_env = ex.select(f"env__id == '{env_id}'")
+    assert len(ex_env.hypotheses) == len(set(df.index.get_level_values('algo')))
+    for h in ex_env.hypotheses:
+      assert all(r.name.split('-')[1] == env_id for r in h.runs)
+
+    # The config table is computed only once for the same config_fn.
+    calls = []
+    counting_config_fn = lambda r: calls.append(r) or nested_config_fn(r)
+    runs.varied_config_keys(config_fn=counting_config_fn)
+    runs.to_dataframe(config_fn=counting_config_fn)
+    assert len(calls) == len(runs)
+
+    # ... until the config of a run is replaced.
+    for r in runs:
+      r.config = {'algo': r.name.split('-')[0]}
+    assert runs.varied_config_keys() == ('algo',)
+    for i, r in enumerate(runs):
+      r.config = {**r.config, 'lr': 0.1 * (i % 2)}
+    assert runs.varied_config_keys() == ('algo', 'lr')
+
   def test_to_dataframe_multiindex(self, runs_gridsearch: RunList):
     runs = runs_gridsearch
 
@@ -386,6 +440,22 @@ class TestHypothesis(_TestBase):
     assert h.name == 'generator'
     assert len(h) == 3
 
+    # the public constructor is type-checked, but the internal one is not.
+    with pytest.raises(TypeError):
+      Hypothesis(0, [r0])  # type: ignore
+    h = Hypothesis._trusted("trusted", RunList._trusted([r0]), config=None)
+    assert h.name == 'trusted'
+    assert h.runs.to_list() == [r0]
+    assert h.config is None and h.style == {}
+
+  def test_empty(self):
+    assert Hypothesis("h", []).empty()
+    assert Hypothesis("h", [Run("r0", pd.DataFrame({"y": []}))]).empty()
+    assert not Hypothesis("h", [
+        Run("r0", pd.DataFrame({"y": []})),
+        Run("r1", pd.DataFrame({"y": [1, 2]})),
+    ]).empty()
+
   def test_plot_method(self):
     import expt.plot
     h = Hypothesis("h", [])
@@ -393,7 +463,215 @@ class TestHypothesis(_TestBase):
 
   def test_properties(self):
     # test gropued, columns, mean, std, min, max, etc.
-    pass
+    # yapf: disable
+    h = Hypothesis.of(name="h", runs=[
+        Run("r0", pd.DataFrame({
+            "x": [0, 1, 2, 3],
+            "y": [0.0, np.nan, 2.0, 3.0],
+            "s": ["a", "b", "c", "d"],
+        })),
+        Run("r1", pd.DataFrame({
+            "x": [0, 2, 4],
+            "y": [1.0, 3.0, 5.0],
+            "z": np.array([1, 2, 3], dtype=np.float32),
+            "c": pd.Categorical(["u", "v", "u"]),
+        }, index=[0, 2, 4])),
+        Run("r2", pd.DataFrame({
+            "x": [10, 11],
+        }, index=[1, 3])),
+    ])
+    # yapf: enable
+    assert h.columns == ['x', 'y', 's', 'z', 'c']
+
+    # Aggregations should be equivalent to those of pandas groupby.
+    for method in ('mean', 'std', 'min', 'max'):
+      expected = getattr(h.grouped, method)(numeric_only=True)
+      pd.testing.assert_frame_equal(getattr(h, method)(), expected)
+    assert h.min()['x'].dtype == np.int64
+    assert h.mean()['z'].dtype == np.float32
+
+    # The aligned array is built only once, until the runs change.
+    aligned = h._aligned
+    assert aligned is not None and aligned.values.shape == (3, 5, 3)
+    assert h._aligned is aligned
+
+    h.runs.extend([Run("r3", pd.DataFrame({"x": [100]}, index=[4]))])
+    assert h._aligned is not aligned
+    assert h.max()['x'][4] == 100
+
+    aligned = h._aligned
+    h.runs[3].df = pd.DataFrame({"x": [200]}, index=[4])
+    assert h._aligned is not aligned
+    assert h.max()['x'][4] == 200
+
+    # The array keeps the common dtype of the columns, e.g. float32.
+    h32 = Hypothesis.of([
+        Run(f"r{i}", pd.DataFrame({"y": [1.5, 2.5 + i]}, dtype=np.float32))
+        for i in range(2)
+    ])
+    assert h32._aligned.values.dtype == np.float32
+    for method in ('mean', 'std', 'min', 'max'):
+      expected = getattr(h32.grouped, method)(numeric_only=True)
+      pd.testing.assert_frame_equal(getattr(h32, method)(), expected)
+
+    # grouped is memoized as well, until the runs change.
+    grouped = h.grouped
+    assert h.grouped is grouped
+    h.runs = RunList(h.runs[:2])
+    assert h.grouped is not grouped
+    assert h.grouped.ngroups == 5
+
+    # Unsupported arguments or dtypes fall back to pandas.
+    pd.testing.assert_frame_equal(
+        h.std(ddof=0), h.grouped.std(ddof=0, numeric_only=True))
+    h_bool = Hypothesis.of([Run("b", pd.DataFrame({"b": [True, False]}))])
+    assert h_bool._aligned is None
+    pd.testing.assert_frame_equal(h_bool.mean(),
+                                  h_bool.grouped.mean(numeric_only=True))
+
+    # So do runs that barely share steps, where alignment takes much memory.
+    h_disjoint = Hypothesis.of([
+        Run(f"r{i}", pd.DataFrame({"y": [1.0, 2.0]}, index=[i, i + 0.5]))
+        for i in range(4)
+    ])
+    assert h_disjoint._aligned is None
+    pd.testing.assert_frame_equal(h_disjoint.max(),
+                                  h_disjoint.grouped.max(numeric_only=True))
+
+  def test_properties_arrow(self):
+    pa = pytest.importorskip("pyarrow")
+    # yapf: disable
+    dfs = [
+        pd.DataFrame({"x": [0, 1, 2], "y": [0.0, np.nan, 2.0]}),
+        pd.DataFrame({"x": [3, 4], "y": [1.0, 3.0], "s": ["a", "b"]},
+                     index=[1, 2]),
+    ]
+    # yapf: enable
+    h = Hypothesis.of([Run(f"r{i}", df) for i, df in enumerate(dfs)])
+    h_arrow = Hypothesis.of([
+        Run(f"r{i}", df.astype({
+            "x": pd.ArrowDtype(pa.int64()),
+            "y": pd.ArrowDtype(pa.float64()),  # NaN becomes null
+            **({"s": pd.ArrowDtype(pa.string())} if "s" in df else {}),
+        })) for i, df in enumerate(dfs)
+    ])
+
+    # Reductions work on the pyarrow-backed columns directly.
+    assert h_arrow._aligned is not None
+    for method in ('mean', 'std', 'min', 'max'):
+      pd.testing.assert_frame_equal(
+          getattr(h_arrow, method)(), getattr(h, method)())
+
+  def test_running_moments(self):
+    rng = np.random.RandomState(0)
+    logs = [
+        pd.DataFrame({
+            "y": rng.randn(n),
+            "z": rng.randn(n).astype(np.float32),
+        }, index=np.arange(n) + 5 * i) for i, n in enumerate([30, 40])
+    ]
+    logs[1].iloc[::3, 0] = np.nan
+    runs = [Run(f"r{i}", log.iloc[:10]) for i, log in enumerate(logs)]
+    h = Hypothesis.of(runs)
+
+    def _check():
+      for method in ('mean', 'std'):
+        expected = getattr(h.grouped, method)(numeric_only=True)
+        pd.testing.assert_frame_equal(getattr(h, method)(), expected)
+      assert h.mean()['z'].dtype == np.float32
+
+    # The first aggregation uses the aligned array only.
+    _check()
+    assert h._moments is None and h._cached('aligned', lambda: None)
+
+    # Only the rows appended to the runs are fed to the running moments,
+    # derived from the aligned array of the runs before.
+    for run, log in zip(runs, logs):
+      run.df = log.iloc[:12]
+    _check()
+    moments = h._moments
+    assert moments is not None
+    assert 'aligned' not in h._cache
+    for n in (15, 25, 40):
+      for run, log in zip(runs, logs):
+        run.df = log.iloc[:n]
+      _check()
+      assert h._moments is moments
+    h.runs.extend([Run("r2", logs[0].iloc[5:20])])
+    _check()
+    assert h._moments is moments
+
+    # min() or max() need the aligned array, which replaces the moments.
+    h.min()
+    assert h._moments is None
+    h.runs[2].df = logs[0].iloc[5:25]
+    _check()
+    moments = h._moments
+    assert moments is not None
+
+    # Runs that have changed otherwise are aggregated from scratch: e.g.
+    # replaced with a different log, or a value filled in at a step fed before.
+    runs[0].df = logs[0].iloc[:30] + 1
+    _check()
+    assert h._moments is None
+
+    df = logs[1].copy()
+    df.iloc[-2, 0] = np.nan
+    runs[1].df = df
+    _check()
+    assert h._moments is None
+    df = pd.concat([logs[1], logs[1].iloc[-1:].set_axis([1000], axis=0)])
+    runs[1].df = df
+    _check()
+    assert h._moments is None
+
+    h = Hypothesis.of([Run("r", pd.DataFrame({"y": [0.5]}))])
+    assert h.mean()['y'][0] == 0.5
+    h.runs[0].df = pd.DataFrame({"y": [50.0, 1.0]})
+    assert h.mean()['y'][0] == 50.0
+
+  def test_aggregate_columns(self):
+    # "eval" is logged less frequently than "loss", and stored sparse.
+    dfs = [
+        pd.DataFrame({
+            "loss": np.arange(10.0) + i,
+            "eval": [10.0 * i if step % 5 == 0 else np.nan
+                     for step in range(10)],  # yapf: disable
+        }) for i in range(3)
+    ]
+    h = Hypothesis.of([
+        Run(f"r{i}", df.astype({"eval": pd.SparseDtype(float, np.nan)}))
+        for i, df in enumerate(dfs)
+    ])
+
+    # Only the steps where the requested columns have values are aligned.
+    for method in ('mean', 'std', 'min', 'max'):
+      df = getattr(h, method)(columns=['eval'])
+      assert list(df.columns) == ['eval'] and list(df.index) == [0, 5]
+      expected = getattr(Hypothesis.of([Run("r", df) for df in dfs]), method)()
+      np.testing.assert_allclose(df['eval'], expected['eval'].dropna())
+    assert h._cached(('aligned', ('eval',), None), lambda: None) is not None
+
+    df = h.mean(columns=['loss', 'eval', 'unknown'])
+    assert list(df.columns) == ['loss', 'eval'] and len(df) == 10
+    np.testing.assert_array_equal(df['loss'], np.arange(10.0) + 1)
+
+    # Runs with disjoint steps are aggregated by pandas, with the same dtypes.
+    dfs = [
+        df.set_axis(np.arange(10) + 0.5 * i, axis=0)
+        for i, df in enumerate(dfs)
+    ]
+    h = Hypothesis.of([
+        Run(f"r{i}", df.astype({"eval": pd.SparseDtype(float, np.nan)}))
+        for i, df in enumerate(dfs)
+    ])
+    h_dense = Hypothesis.of([Run(f"r{i}", df) for i, df in enumerate(dfs)])
+    assert h._aligned is None
+    for method in ('mean', 'std', 'min', 'max'):
+      for columns in (None, ['eval']):
+        pd.testing.assert_frame_equal(
+            getattr(h, method)(columns=columns),
+            getattr(h_dense, method)(columns=columns))
 
   def test_config(self):
     """Tests Hypothesis.config."""
@@ -460,6 +738,24 @@ class TestHypothesis(_TestBase):
     np.testing.assert_array_almost_equal(df['y'].values, [16, 19])
     assert np.isnan(df['z']).all()
 
+    # (4) summaries are memoized, until the runs change
+    df['y'] = 0  # a copy is returned; should not affect the cache
+    df2 = h.summary(individual_runs=True)
+    np.testing.assert_array_almost_equal(df2['y'].values, [16, 19])
+    assert h.summary(individual_runs=True) is not df2
+
+    # ... except for custom aggregate functions, e.g. lambdas.
+    num_summaries = len(h._cached('summary', dict))
+    h.summary(aggregate=lambda series: series.max())
+    h.summary(aggregate={c: lambda series: series.max() for c in "xyz"})
+    assert len(h._cached('summary', dict)) == num_summaries
+
+    h.runs.extend([
+        Run("r2", pd.DataFrame({"y": [100]}, index=pd.Index([0], name='x')))
+    ])
+    df = h.summary(individual_runs=True)
+    assert len(df) == 3 and df['y'][2] == 100
+
   def test_resample(self):
     h: Hypothesis = self._fixture()
     h.config = {"kind": "resample"}
@@ -534,6 +830,31 @@ class TestHypothesis(_TestBase):
     with pytest.raises(ValueError, match="Unknown column"):
       h_interpolated = h.interpolate("unknown_index", n_samples=1000)
 
+  def test_interpolate_missing_values(self):
+    """Tests interpolate on columns with NaNs, against scipy interp1d."""
+    import scipy.interpolate
+
+    # yapf: disable
+    df = pd.DataFrame({
+        "a": [0.0, 1.0, 4.0, 9.0, 16.0, 25.0],
+        "b": [0.0, np.nan, 2.0, np.nan, 4.0, 5.0],
+        "c": [np.nan, np.nan, np.nan, 1.0, np.nan, np.nan],
+        "d": [1, 2, 3, 4, 5, 6],
+    }, index=[5, 0, 1, 2, 3, 4])
+    # yapf: enable
+    h = Hypothesis.of([Run("r0", df)], name="h")
+    df_interp = h.interpolate(n_samples=13)[0].df
+    assert list(df_interp.columns) == ["a", "b", "c", "d"]
+
+    x_samples = np.linspace(0, 5, 13)
+    np.testing.assert_array_equal(df_interp.index, x_samples)
+    for column in ("a", "b", "d"):
+      y = df[column].dropna()
+      expected = scipy.interpolate.interp1d(
+          y.index, y, fill_value="extrapolate")(x_samples)
+      np.testing.assert_allclose(df_interp[column], expected)
+    assert df_interp["c"].isna().all()  # Less than two data points.
+
   def test_apply(self):
     h: Hypothesis = self._fixture()
     h.config = {"kind": "apply"}
@@ -671,8 +992,43 @@ class TestExperiment(_TestBase):
     )
     assert ex.name == "ex_from_runs"
     assert ex._config_keys == ['algo', 'env_id']  # no 'common_hparam'
+    assert ex._summary_columns == (
+        'global_step', 'ppo_loss', 'reward', 'sac_loss')
     self._validate_ex_gridsearch(ex)
 
+  def test_create_from_runs_lazy(self, runs_gridsearch: RunList,
+                                 monkeypatch):
+    """Summaries should not be computed until they are needed."""
+
+    def _summary(self, **kwargs):
+      raise AssertionError("Hypothesis.summary() should not be called.")
+
+    with monkeypatch.context() as m:
+      m.setattr(Hypothesis, 'summary', _summary)
+      ex = Experiment.from_runs(
+          runs_gridsearch,
+          config_fn=_runs_gridsearch_config_fn,
+          summary_columns=['reward'],
+      )
+      assert ex._summary_columns == ('reward',)
+
+      with pytest.raises(KeyError, match=r"Close matches = \['reward'\]"):
+        Experiment.from_runs(
+            runs_gridsearch,
+            config_fn=_runs_gridsearch_config_fn,
+            summary_columns=['rewrd'],
+        )
+
+      # select() on config keys or names does not need summaries either.
+      ex_sac = ex.select('algo == "sac"').select('env_id != "humanoid"')
+      assert [h.name for h in ex_sac] == [
+          'algo=sac; env_id=halfcheetah', 'algo=sac; env_id=hopper'
+      ]
+      assert all(h is ex[h.name] for h in ex_sac)  # a view
+
+    assert list(ex._df.columns) == ['hypothesis', 'reward']
+    assert len(ex.select('reward > -1e9').hypotheses) == 6  # needs summaries
+
   def _validate_ex_gridsearch(self, ex: Experiment):
     assert len(ex.hypotheses) == 6
     hypothesis_names = [
@@ -770,6 +1126,18 @@ class TestExperiment(_TestBase):
     # (4) non-standard iterable
     r = V(ex[pd.Series([1, 0])])
     assert r[0] is h1 and r[1] is h0
+    r = V(ex[np.array([True, False])])
+    assert len(r) == 1 and r[0] is h0
+    # (5) mixed
+    r = V(ex[['hyp1', 0]])
+    assert r[0] is h1 and r[1] is h0
+
+    # positional index is updated when a hypothesis is added.
+    assert len(ex.hypotheses) == 2 and ex[-1] is h1
+    h2 = Hypothesis("hyp2", Run('r2', pd.DataFrame({"a": [7, 8, 9]})))
+    ex.add_hypothesis(h2)
+    assert len(ex.hypotheses) == 3 and ex[2] is h2 and ex[-1] is h2
+    assert V(ex[[2, 0]]) == [h2, h0]
 
     with pytest.raises(NotImplementedError):  # TODO
       r = V(ex[['hyp1', 'hyp0'], 'a'])
@@ -844,6 +1212,16 @@ class TestExperiment(_TestBase):
     assert ex.select_top("score", descending=False, k=3,
                          ) == [hypos[0], hypos[1], hypos[2]]  # yapf: disable
 
+    # ties are broken by the order of hypotheses; NaN comes last.
+    scores = {"hyp0": 1, "hyp1": np.nan, "hyp2": 2, "hyp3": 1, "hyp4": 2}
+    assert ex.select_top(lambda h: scores[h.name], k=4) == [
+        hypos[2], hypos[4], hypos[0], hypos[3]]  # yapf: disable
+    assert ex.select_top(lambda h: scores[h.name], k=5, descending=False,
+                         ) == [hypos[0], hypos[3], hypos[2], hypos[4],
+                               hypos[1]]  # yapf: disable
+    assert ex.select_top(lambda h: (0, h.name)) is hypos[4]  # non-numeric
+    assert ex.select_top("score", k=2, n_jobs=2) == [hypos[4], hypos[3]]
+
     # invalid inputs
     with pytest.raises(ValueError, match='k must be greater than 0'):
       ex.select_top("score", k=0)
@@ -878,6 +1256,53 @@ class TestExperiment(_TestBase):
     assert ex_interpolated._config_keys == ex._config_keys
     assert ex_interpolated._summary_columns == ex._summary_columns == ('x', 'y')
 
+  def test_summary_aggregate(self):
+    """Tests the default (vectorized) aggregation of Experiment.summary()."""
+    rng = np.random.default_rng(0)
+    hypotheses = []
+    for i in range(3):
+      df = pd.DataFrame(rng.normal(size=(30 + i, 4)), columns=list("abcd"))
+      df.iloc[rng.random(df.shape) < 0.3] = np.nan
+      df["d"] = np.nan
+      df["e"] = np.arange(len(df))
+      df["s"] = "str"
+      hypotheses.append(Hypothesis(f"h{i}", [Run(f"r{i}", df)]))
+    ex = Experiment("ex", hypotheses)
+
+    df = ex.summary()
+    assert list(df.columns) == ['name', 'index', 'a', 'b', 'c', 'd', 'e', 's']
+    mean_last = Experiment.AGGREGATE_MEAN_LAST(0.1)
+    expected = ex.summary(aggregate=lambda series: mean_last(series))
+    pd.testing.assert_frame_equal(df, expected)
+    assert df['d'].isna().all() and df['s'].isna().all()
+    assert df['e'][2] == np.mean([29, 30, 31])
+
+  def test_parallel_transform(self):
+    """Tests resample, interpolate, and apply with n_jobs/executor."""
+    import concurrent.futures
+
+    hypotheses = [TestHypothesis._fixture().rename(f"h{i}") for i in range(4)]
+    ex = Experiment(name="parallel", hypotheses=hypotheses)
+
+    def _assert_same(ex1: Experiment, ex2: Experiment):
+      assert list(ex1.keys()) == list(ex2.keys())
+      for h1, h2 in zip(ex1.hypotheses, ex2.hypotheses):
+        for df1, df2 in zip(h1._dataframes, h2._dataframes):
+          pd.testing.assert_frame_equal(df1, df2)
+
+    _assert_same(ex.interpolate("x", n_samples=11),
+                 ex.interpolate("x", n_samples=11, n_jobs=4))
+    _assert_same(ex.resample(n_samples=3),
+                 ex.resample(n_samples=3, n_jobs=-1))
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+      _assert_same(ex.apply(lambda df: df.iloc[:2]),
+                   ex.apply(lambda df: df.iloc[:2], executor=executor))
+
+    h = hypotheses[0]
+    h2 = h.apply(lambda df: df[['y']] * 2, n_jobs=2)
+    assert h2.name == h.name and len(h2) == len(h)
+    np.testing.assert_array_equal(h2[1].df['y'], [6, 14, 22, 30, 38])
+
   def test_select_query(self, runs_gridsearch: RunList):
     """Tests Experiment.select()"""
 
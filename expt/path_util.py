@@ -1,10 +1,14 @@
 """Path (local- and remote-) related utilities."""
 
 import ast
+import asyncio
 import contextlib
+import contextvars
+import datetime
 import fnmatch
 import functools
 from glob import glob as local_glob
+import hashlib
 import io
 import os
 import os.path
@@ -14,11 +18,15 @@ from pathlib import PurePosixPath
 import shlex
 import shutil
 import socket
-import stat
+import stat as statlib
 import subprocess
 import sys
-from typing import (Any, Callable, Dict, List, Sequence, Tuple, TYPE_CHECKING,
-                    Union)
+import tempfile
+import threading
+import time
+from typing import (Any, AsyncIterator, Awaitable, Callable, Dict, Hashable,
+                    List, NamedTuple, Optional, Sequence, Tuple, TYPE_CHECKING,
+                    TypeVar, Union)
 from typing_extensions import Protocol
 import urllib.parse
 
@@ -26,11 +34,20 @@ import multiprocessing_utils
 
 PathType = Union[str, os.PathLike, PurePath]
 
+T = TypeVar('T')
+
 if TYPE_CHECKING:
+  import asyncssh
   import fabric
+  import fsspec
   import paramiko
 
 
+class FileStat(NamedTuple):
+  size: int
+  mtime: Optional[float]  # None if unknown
+
+
 class PathUtilInterface(Protocol):
   """Interface for path utils."""
 
@@ -50,6 +67,38 @@ class PathUtilInterface(Protocol):
   def open(self, path: PathType, *, mode='r'):
     raise NotImplementedError
 
+  def stat(self, path: PathType) -> FileStat:
+    raise NotImplementedError
+
+  # Asynchronous API. By default, the blocking methods are offloaded to
+  # a thread; backends may override them with a native implementation.
+
+  async def aglob(self, pattern: PathType) -> Sequence[str]:
+    return await _to_thread(self.glob, pattern)
+
+  async def aexists(self, path: PathType) -> bool:
+    return await _to_thread(self.exists, path)
+
+  async def aisdir(self, path: PathType) -> bool:
+    return await _to_thread(self.isdir, path)
+
+  @contextlib.asynccontextmanager
+  async def aopen(self, path: PathType, *, mode='r') -> AsyncIterator[Any]:
+    stack = contextlib.ExitStack()
+    f = await _to_thread(
+        lambda: stack.enter_context(self.open(path, mode=mode)))
+    try:
+      yield ThreadedAsyncFile(f)
+    finally:
+      await _to_thread(stack.close)
+
+  async def adownload(self, path: PathType, tmpdir: str) -> str:
+    download_local = getattr(self, 'download_local', None)
+    if download_local is None:
+      raise NotImplementedError(
+          f"{type(self).__name__} does not support downloading files.")
+    return await _to_thread(download_local, path, tmpdir)
+
 
 def _to_path_string(path: PathType) -> str:
   if isinstance(path, (PurePath, Path)):
@@ -60,6 +109,129 @@ def _to_path_string(path: PathType) -> str:
     raise TypeError(str(type(path)))
 
 
+async def _to_thread(fn: Callable[..., T], *args, **kwargs) -> T:
+  loop = asyncio.get_running_loop()
+  func = functools.partial(fn, *args, **kwargs)
+  return await loop.run_in_executor(None, func)
+
+
+class ThreadedAsyncFile:
+  """Wraps a (blocking) file object, so that reads run in a thread."""
+
+  def __init__(self, f):
+    self._f = f
+
+  async def read(self, size: int = -1):
+    return await _to_thread(self._f.read, size)
+
+  async def readline(self):
+    return await _to_thread(self._f.readline)
+
+
+# ---------------------------------------------------------------------------
+# Metadata Cache
+# ---------------------------------------------------------------------------
+
+# Time-to-live (in seconds) for the cached metadata (listings, stat results).
+METADATA_CACHE_TTL = float(os.environ.get('EXPT_METADATA_CACHE_TTL', '60'))
+
+
+class MetadataCache:
+  """A TTL cache for file metadata (directory listings, stat results, etc.)
+  that is shared by all the backends.
+
+  The cache is effective only within a session(): outside of a session,
+  every lookup goes to the backend as usual. Cached entries expire after
+  `ttl` seconds, and are dropped when the outermost session exits so that
+  a new session (e.g., another `RunLoader.get_runs()`) sees new files.
+  Local files are never cached, as looking them up is cheap.
+  """
+
+  def __init__(self, ttl: float):
+    self.ttl = ttl
+    self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+    self._lock = threading.Lock()
+
+    # Thread-local (and process-local) nesting level of sessions.
+    self._local_storage = multiprocessing_utils.local()
+
+  @property
+  def active(self) -> bool:
+    return getattr(self._local_storage, 'count', 0) > 0
+
+  @contextlib.contextmanager
+  def session(self):
+    S: Any = self._local_storage
+    S.count = getattr(S, 'count', 0) + 1
+    try:
+      yield self
+    finally:
+      S.count -= 1
+      if S.count == 0:
+        self.clear()
+
+  @contextlib.contextmanager
+  def bypass(self):
+    """Within the context, lookups go to the backend without the cache,
+    e.g., when fresh metadata is required to validate cached contents."""
+    S: Any = self._local_storage
+    count = getattr(S, 'count', 0)
+    S.count = 0
+    try:
+      yield self
+    finally:
+      S.count = count
+
+  def memoize(self, key: Hashable, fn: Callable[[], T]) -> T:
+    """Return the cached value for `key`, or compute (and cache) it with
+    `fn()` if the entry does not exist or has been expired. When no session
+    is active, `fn()` is always called without being cached."""
+    if not self.active:
+      return fn()
+
+    now = time.monotonic()
+    with self._lock:
+      entry = self._entries.get(key, None)
+    if entry is not None and now - entry[0] < self.ttl:
+      return entry[1]
+
+    value = fn()
+    with self._lock:
+      self._entries[key] = (now, value)
+    return value
+
+  async def amemoize(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+    """An asynchronous version of memoize()."""
+    if not self.active:
+      return await fn()
+
+    now = time.monotonic()
+    with self._lock:
+      entry = self._entries.get(key, None)
+    if entry is not None and now - entry[0] < self.ttl:
+      return entry[1]
+
+    value = await fn()
+    with self._lock:
+      self._entries[key] = (now, value)
+    return value
+
+  def clear(self):
+    with self._lock:
+      self._entries.clear()
+
+  def _reset_lock(self):
+    # The lock might have been held by another thread at the time of fork.
+    self._lock = threading.Lock()
+
+
+_metadata_cache = MetadataCache(ttl=METADATA_CACHE_TTL)
+
+if hasattr(os, 'register_at_fork'):
+  # pylint: disable-next=protected-access
+  os.register_at_fork(after_in_child=_metadata_cache._reset_lock)
+
+
 # ---------------------------------------------------------------------------
 # Local Files
 # ---------------------------------------------------------------------------
@@ -85,8 +257,21 @@ class LocalPathUtil(PathUtilInterface):
 
   def open(self, path: PathType, *, mode='r'):
     path = _to_path_string(path)
+    if 'b' in mode:
+      return io.open(path, mode=mode)
     return io.open(path, mode=mode, encoding='utf-8')
 
+  def stat(self, path: PathType) -> FileStat:
+    st = os.stat(_to_path_string(path))
+    return FileStat(size=st.st_size, mtime=st.st_mtime)
+
+  async def adownload(self, path: PathType, tmpdir: str) -> str:
+    if not os.path.isdir(tmpdir):
+      raise FileNotFoundError(f"Not a directory: `{tmpdir}")
+    path = _to_path_string(path)
+    local_path = os.path.join(tmpdir, os.path.basename(path))
+    return await _to_thread(shutil.copyfile, path, local_path)
+
 
 # ---------------------------------------------------------------------------
 # SSH / SFTP / SCP
@@ -213,8 +398,8 @@ class SFTPPathUtil(PathUtilInterface):
           return
 
         head, *tail = path_parts
-        dir_ls = sftp.listdir(str(context))
-        for f in dir_ls:
+        dir_ls = self._listdir_attr(sftp, uri, str(context))
+        for f in (dir_ls or {}):
           if fnmatch.fnmatch(f, head):
             yield from walk(context / f, tail)
 
@@ -237,27 +422,200 @@ class SFTPPathUtil(PathUtilInterface):
 
       return [prefix + p for p in walk(context, path_parts)]
 
-  def exists(self, path: PathType) -> bool:
-    with self._establish(path) as (sftp, _, remote_path):
+  @staticmethod
+  def _listdir_attr(
+      sftp: 'paramiko.SFTPClient',
+      uri: urllib.parse.ParseResult,
+      remote_dir: str,
+  ) -> Optional[Dict[str, 'paramiko.SFTPAttributes']]:
+    """List a remote directory as {filename: attributes}, or None if the
+    directory does not exist. Listings are cached within a session()."""
+
+    def _list():
       try:
-        sftp.stat(remote_path)
-        return True
-      except FileNotFoundError:
-        return False
+        return {a.filename: a for a in sftp.listdir_attr(remote_dir)}
+      except (FileNotFoundError, NotADirectoryError):
+        return None
 
-  def isdir(self, path: PathType) -> bool:
-    with self._establish(path) as (sftp, _, remote_path):
+    key = ('sftp', uri.netloc, 'listdir', remote_dir)
+    return _metadata_cache.memoize(key, _list)
+
+  @classmethod
+  def _stat(
+      cls,
+      sftp: 'paramiko.SFTPClient',
+      uri: urllib.parse.ParseResult,
+      remote_path: str,
+  ) -> Optional['paramiko.SFTPAttributes']:
+    """Stat a remote file (following symlinks), or None if not exists.
+
+    Within a session(), the listing of the parent directory is fetched (once)
+    and reused, so that looking up many files in the same directory (e.g.,
+    progress.csv, config.yaml, event files) costs only one round trip."""
+    p = PurePosixPath(remote_path)
+    if _metadata_cache.active and p.name:
+      listing = cls._listdir_attr(sftp, uri, str(p.parent))
+      if listing is None:
+        return None  # parent directory does not exist
+      attr = listing.get(p.name, None)
+      if attr is None or not statlib.S_ISLNK(attr.st_mode or 0):
+        return attr
+
+    def _stat():
       try:
-        lstat = sftp.stat(remote_path)
-        return stat.S_ISDIR(lstat.st_mode)  # type: ignore
+        return sftp.stat(remote_path)
       except FileNotFoundError:
-        return False
+        return None
+
+    key = ('sftp', uri.netloc, 'stat', remote_path)
+    return _metadata_cache.memoize(key, _stat)
+
+  def exists(self, path: PathType) -> bool:
+    with self._establish(path) as (sftp, uri, remote_path):
+      return self._stat(sftp, uri, remote_path) is not None
+
+  def isdir(self, path: PathType) -> bool:
+    with self._establish(path) as (sftp, uri, remote_path):
+      lstat = self._stat(sftp, uri, remote_path)
+      return lstat is not None and statlib.S_ISDIR(lstat.st_mode)  # type: ignore
+
+  def stat(self, path: PathType) -> FileStat:
+    with self._establish(path) as (sftp, uri, remote_path):
+      st = self._stat(sftp, uri, remote_path)
+    if st is None:
+      raise FileNotFoundError(_to_path_string(path))
+    return FileStat(size=st.st_size or 0, mtime=st.st_mtime)
 
   @contextlib.contextmanager
   def open(self, path: PathType, *, mode='r'):
     # Open a remote file, e.g., `with open(...) as f:`
     with self._establish(path) as (sftp, _, remote_path):
-      yield sftp.open(remote_path)
+      with sftp.open(remote_path, mode=mode) as f:
+        yield f
+
+  # Asynchronous API, natively implemented with asyncssh (if available).
+  # Within an asession(), SSH connections are cached and shared by all tasks.
+  _async_cache = contextvars.ContextVar('expt_sftp_async_cache', default=None)
+
+  @staticmethod
+  def _has_asyncssh() -> bool:
+    try:
+      import asyncssh  # pylint: disable=unused-import  # noqa
+      return True
+    except ImportError:
+      return False
+
+  @classmethod
+  @contextlib.asynccontextmanager
+  async def asession(cls):
+    if cls._async_cache.get() is not None:
+      yield  # nested session, reuse the cache
+      return
+
+    # (hostname, username, port) -> Future[(sftp, conn)]
+    cache: Dict[Tuple[str, str, int], asyncio.Future] = {}
+    token = cls._async_cache.set(cache)  # type: ignore
+    try:
+      yield
+    finally:
+      cls._async_cache.reset(token)
+      for future in cache.values():
+        with contextlib.suppress(Exception):
+          sftp, conn = await future
+          sftp.exit()
+          conn.close()
+          await conn.wait_closed()
+
+  @staticmethod
+  async def _aconnect(
+      uri: urllib.parse.ParseResult,
+  ) -> Tuple['asyncssh.SFTPClient', 'asyncssh.SSHClientConnection']:
+    import asyncssh
+    try:
+      conn = await asyncssh.connect(
+          uri.hostname or '',
+          port=uri.port or (),
+          username=uri.username or (),
+          connect_timeout=5.0,
+      )
+    except (OSError, asyncio.TimeoutError, asyncssh.Error) as ex:
+      raise IOError(
+          f"Cannot establish SSH connection to `{uri.netloc}`: {str(ex)}"
+      ) from ex
+    sftp = await conn.start_sftp_client()
+    return sftp, conn
+
+  @classmethod
+  @contextlib.asynccontextmanager
+  async def _aestablish(cls, path: PathType):
+    path = _to_path_string(path)
+    uri = urllib.parse.urlparse(path)
+    remote_path = uri.path[1:] if uri.path.startswith('/') else uri.path
+
+    cache = cls._async_cache.get()
+    if cache is not None:
+      key = (uri.hostname, uri.username, uri.port)
+      if key not in cache:
+        cache[key] = asyncio.ensure_future(cls._aconnect(uri))
+      # Do not let a cancelled task cancel the shared connection.
+      sftp, _ = await asyncio.shield(cache[key])
+      yield sftp, uri, remote_path
+    else:
+      sftp, conn = await cls._aconnect(uri)
+      try:
+        yield sftp, uri, remote_path
+      finally:
+        sftp.exit()
+        conn.close()
+        await conn.wait_closed()
+
+  async def aglob(self, pattern: PathType) -> Sequence[str]:
+    if not self._has_asyncssh():
+      return await super().aglob(pattern)
+
+    import asyncssh
+    async with self._aestablish(pattern) as (sftp, uri, remote_path):
+      if not remote_path:
+        return []
+      try:
+        matches = await sftp.glob(remote_path)
+      except asyncssh.SFTPNoSuchFile:
+        return []
+      prefix = uri.scheme + '://' + uri.netloc + '/'
+      return [prefix + str(p) for p in matches]
+
+  async def aexists(self, path: PathType) -> bool:
+    if not self._has_asyncssh():
+      return await super().aexists(path)
+    async with self._aestablish(path) as (sftp, _, remote_path):
+      return await sftp.exists(remote_path)
+
+  async def aisdir(self, path: PathType) -> bool:
+    if not self._has_asyncssh():
+      return await super().aisdir(path)
+    async with self._aestablish(path) as (sftp, _, remote_path):
+      return await sftp.isdir(remote_path)
+
+  @contextlib.asynccontextmanager
+  async def aopen(self, path: PathType, *, mode='r') -> AsyncIterator[Any]:
+    if not self._has_asyncssh():
+      async with super().aopen(path, mode=mode) as f:
+        yield f
+      return
+    async with self._aestablish(path) as (sftp, _, remote_path):
+      async with sftp.open(remote_path, mode) as f:
+        yield f
+
+  async def adownload(self, path: PathType, tmpdir: str) -> str:
+    if not self._has_asyncssh():
+      return await super().adownload(path, tmpdir)
+    if not os.path.isdir(tmpdir):
+      raise FileNotFoundError(f"Not a directory: `{tmpdir}")
+
+    local_path = os.path.join(tmpdir, os.path.basename(_to_path_string(path)))
+    async with self._aestablish(path) as (sftp, _, remote_path):
+      await sftp.get(remote_path, local_path)
+    return local_path
 
   def download_local(self, path: PathType, tmpdir: str) -> str:
     """Fetches and download the remote file into a local temporary directory.
@@ -361,6 +719,11 @@ class GCloudPathUtil(PathUtilInterface):
     path = _to_path_string(path)
     return _import_gfile().GFile(path, mode=mode)  # noqa
 
+  def stat(self, path: PathType) -> FileStat:
+    path = _to_path_string(path)
+    st = _import_gfile().stat(path)  # noqa
+    return FileStat(size=st.length, mtime=st.mtime_nsec / 1e9)
+
 
 def _import_gfile():
   # Reference: https://www.tensorflow.org/api_docs/python/tf/io/gfile
@@ -417,28 +780,270 @@ def use_gsutil(value: bool):
     USE_GSUTIL = False
 
 
+# ---------------------------------------------------------------------------
+# fsspec (S3, HTTP, in-memory, etc.)
+# ---------------------------------------------------------------------------
+
+
+class FsspecPathUtil(PathUtilInterface):
+  """An adapter that wraps any fsspec filesystem as a path backend.
+
+  This is not registered by default; register one per protocol, e.g.:
+
+    >>> path_util.register_backend(FsspecPathUtil('s3', anon=True))
+    >>> path_util.register_backend(FsspecPathUtil(
+    ...     fsspec.filesystem('blockcache', target_protocol='http'),
+    ...     protocols=('http', 'https')))
+  """
+
+  def __init__(
+      self,
+      fs: Union[str, 'fsspec.AbstractFileSystem'],
+      *,
+      protocols: Optional[Sequence[str]] = None,
+      **storage_options,
+  ):
+    """Create a path backend.
+
+    Args:
+      fs: An fsspec filesystem instance, or the name of the protocol to create
+        the filesystem with (via `fsspec.filesystem`).
+      protocols: URL schemes (e.g. 's3') that this backend should handle.
+        Defaults to the protocol(s) of the filesystem.
+      storage_options: Passed to `fsspec.filesystem` if `fs` is a str.
+    """
+    if isinstance(fs, str):
+      try:
+        import fsspec
+      except ImportError as ex:
+        raise ImportError("To use FsspecPathUtil, 'fsspec' is required. " +
+                          str(ex)) from ex
+      fs = fsspec.filesystem(fs, **storage_options)
+    elif storage_options:
+      raise ValueError("storage_options are not allowed with an instance of "
+                       "filesystem.")
+    self.fs = fs
+
+    if protocols is None:
+      protocols = fs.protocol
+    if isinstance(protocols, str):
+      protocols = (protocols,)
+    self.protocols: Tuple[str, ...] = tuple(protocols)
+
+  def __repr__(self):
+    return f"<{type(self).__name__}, protocols={self.protocols}>"
+
+  def supports(self, path: PathType) -> bool:  # type: ignore[override]
+    path = _to_path_string(path)
+    return any(path.startswith(p + '://') for p in self.protocols)
+
+  def glob(self, pattern: PathType) -> Sequence[str]:
+    pattern = _to_path_string(pattern)
+    return [self.fs.unstrip_protocol(p) for p in self.fs.glob(pattern)]
+
+  def exists(self, path: PathType) -> bool:
+    return self.fs.exists(_to_path_string(path))
+
+  def isdir(self, path: PathType) -> bool:
+    return self.fs.isdir(_to_path_string(path))
+
+  def open(self, path: PathType, *, mode='r'):
+    path = _to_path_string(path)
+    if 'b' in mode:
+      return self.fs.open(path, mode=mode)
+    return self.fs.open(path, mode=mode, encoding='utf-8')
+
+  def stat(self, path: PathType) -> FileStat:
+    info = self.fs.info(_to_path_string(path))
+    # The modification time is reported differently for each filesystem.
+    mtime = None
+    for k in ('mtime', 'LastModified', 'last_modified', 'updated', 'created'):
+      if info.get(k, None) is not None:
+        mtime = info[k]
+        break
+    if isinstance(mtime, str):
+      mtime = datetime.datetime.fromisoformat(mtime.replace('Z', '+00:00'))
+    if isinstance(mtime, datetime.datetime):
+      mtime = mtime.timestamp()
+    return FileStat(size=info.get('size') or 0,
+                    mtime=float(mtime) if mtime is not None else None)
+
+  def download_local(self, path: PathType, tmpdir: str) -> str:
+    """Download the remote file into a local directory (see SFTPPathUtil)."""
+    if not os.path.isdir(tmpdir):
+      raise FileNotFoundError(f"Not a directory: `{tmpdir}")
+
+    path = _to_path_string(path)
+    local_path = os.path.join(tmpdir, os.path.basename(path))
+    self.fs.get_file(path, local_path)
+    return local_path
+
+
+# ---------------------------------------------------------------------------
+# Local File Cache
+# ---------------------------------------------------------------------------
+
+# Options for the local-disk cache of remote files (see open_cached).
+USE_FILE_CACHE = bool(
+    ast.literal_eval(os.environ.get('EXPT_FILE_CACHE', 'True')))
+FILE_CACHE_DIR = os.environ.get(
+    'EXPT_FILE_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'expt', 'files'))
+FILE_CACHE_SIZE_LIMIT = int(
+    os.environ.get('EXPT_FILE_CACHE_SIZE_LIMIT', str(2 * 1024**3)))  # 2 GiB
+
+
+class LocalFileCache:
+  """A content-addressed, read-through cache of remote files on local disk.
+
+  A cache entry is keyed by the path, size, and mtime of the remote file,
+  so a file that has been modified since is fetched again. When the total
+  size of the cache exceeds `size_limit` (bytes), least recently used
+  entries are evicted. The cache directory can be shared by multiple
+  processes.
+  """
+
+  _TMP_PREFIX = '.tmp-'
+
+  def __init__(self, cache_dir: str, size_limit: int):
+    self.cache_dir = cache_dir
+    self.size_limit = size_limit
+    # The total size of the cache as of the last scan, plus the size of
+    # entries fetched since (by this process).
+    self._size: Optional[int] = None
+
+  def _entry_path(self, path: str, st: FileStat) -> str:
+    key = hashlib.sha256(f"{path}\0{st.size}\0{st.mtime!r}".encode('utf-8'))
+    return os.path.join(self.cache_dir, key.hexdigest())
+
+  def fetch(self, path: PathType, st: Optional[FileStat] = None) -> str:
+    """Return the path of a local copy of the (remote) file, fetching it
+    first if not cached yet."""
+    path = _to_path_string(path)
+    if st is None:
+      with _metadata_cache.bypass():  # Must be fresh to validate the cache.
+        st = stat(path)
+    if st.mtime is None:
+      raise ValueError(f"Cannot determine the mtime of `{path}`.")
+
+    entry = self._entry_path(path, st)
+    if os.path.exists(entry):
+      with contextlib.suppress(OSError):
+        os.utime(entry)  # mark as the most recently used
+      return entry
+
+    os.makedirs(self.cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=self._TMP_PREFIX, dir=self.cache_dir)
+    try:
+      with io.open(fd, 'wb') as dst, open(path, mode='rb') as src:
+        if hasattr(src, 'prefetch'):  # paramiko: pipeline the remote reads
+          src.prefetch()
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+      os.replace(tmp_path, entry)  # atomic, even if fetched concurrently
+    except BaseException:
+      with contextlib.suppress(OSError):
+        os.unlink(tmp_path)
+      raise
+
+    if self._size is not None:
+      self._size += st.size
+    if self._size is None or self._size > self.size_limit:
+      self.evict(keep=entry)  # Scan the cache only when likely to be full.
+    return entry
+
+  def evict(self, keep: Optional[str] = None):
+    """Evict least recently used entries until the size limit is met."""
+    entries = []
+    with os.scandir(self.cache_dir) as it:
+      for e in it:
+        if e.name.startswith(self._TMP_PREFIX) or not e.is_file():
+          continue
+        with contextlib.suppress(FileNotFoundError):
+          st = e.stat()
+          entries.append((st.st_mtime, st.st_size, e.path))
+
+    total_size = sum(size for (_, size, _) in entries)
+    for _, size, entry in sorted(entries):
+      if total_size <= self.size_limit:
+        break
+      if entry == keep:
+        continue
+      with contextlib.suppress(FileNotFoundError):
+        os.unlink(entry)
+      total_size -= size
+    self._size = total_size
+
+  def clear(self):
+    if os.path.isdir(self.cache_dir):
+      shutil.rmtree(self.cache_dir, ignore_errors=True)
+    self._size = None
+
+
+file_cache = LocalFileCache(FILE_CACHE_DIR, size_limit=FILE_CACHE_SIZE_LIMIT)
+
+
+def use_file_cache(value: bool):
+  """Configure path_util to cache remote files on local disk (open_cached)."""
+  global USE_FILE_CACHE
+  USE_FILE_CACHE = bool(value)
+
+
 # ---------------------------------------------------------------------------
 # Public Module Interface
 # ---------------------------------------------------------------------------
 
-BACKENDS = [
+# The registry of path backends. For a given path, the first backend that
+# supports the path will be used. LocalPathUtil supports any path, so it
+# should remain the last one.
+BACKENDS: List[PathUtilInterface] = [
     GCloudPathUtil(),
     SFTPPathUtil(),
     LocalPathUtil(),
 ]
 
 
-def _choose_backend(path: PathType) -> PathUtilInterface:
+def register_backend(backend: PathUtilInterface) -> PathUtilInterface:
+  """Register a path backend, taking precedence over the existing ones."""
+  if not callable(getattr(backend, 'supports', None)):
+    raise TypeError(f"Not a valid path backend: {type(backend)}")
+  BACKENDS.insert(0, backend)
+  return backend
+
+
+def unregister_backend(backend: PathUtilInterface):
+  """Remove a path backend that was registered before."""
+  BACKENDS.remove(backend)
+
+
+def get_backend(path: PathType) -> PathUtilInterface:
+  """Return the path backend that handles the given path or URL."""
   for backend in BACKENDS:
     if backend.supports(path):
       return backend
   raise ValueError(f"The path or URL `{path}` is not supported.")
 
 
+@contextlib.contextmanager
 def session():
   """Open a new session (as a context manager), within which expensive
-  remote connection resources (e.g., SSH) can be cached and reused."""
-  return SFTPPathUtil.session()
+  remote connection resources (e.g., SSH) can be cached and reused.
+
+  Within a session, file metadata (listings, stat results) are also cached
+  for `METADATA_CACHE_TTL` seconds; see `MetadataCache`."""
+  with SFTPPathUtil.session(), _metadata_cache.session():
+    yield
+
+
+def clear_metadata_cache():
+  """Discard all the cached file metadata, e.g., to see new files."""
+  _metadata_cache.clear()
+
+
+def set_metadata_cache_ttl(ttl: float):
+  """Configure the time-to-live (in seconds) of the metadata cache."""
+  if ttl < 0:
+    raise ValueError(f"ttl must be non-negative, but given {ttl}")
+  _metadata_cache.ttl = float(ttl)
 
 
 def session_wrap(fn: Callable):
@@ -452,27 +1057,48 @@ def session_wrap(fn: Callable):
   return _wrapped
 
 
+def _memoize(backend: PathUtilInterface, op: str, path: PathType,
+             fn: Callable[[PathType], T]) -> T:
+  """Call `fn(path)` through the metadata cache, except for local files."""
+  if isinstance(backend, LocalPathUtil):
+    return fn(path)
+  key = (type(backend).__name__, op, _to_path_string(path))
+  return _metadata_cache.memoize(key, lambda: fn(path))
+
+
+async def _amemoize(backend: PathUtilInterface, op: str, path: PathType,
+                    fn: Callable[[PathType], Awaitable[T]]) -> T:
+  """An asynchronous version of _memoize()."""
+  if isinstance(backend, LocalPathUtil):
+    return await fn(path)
+  key = (type(backend).__name__, op, _to_path_string(path))
+  return await _metadata_cache.amemoize(key, lambda: fn(path))
+
+
 def glob(pattern: PathType) -> Sequence[str]:
   """A glob function, returning a list of paths matching a pathname pattern.
 
   It supports local file path (i.e., glob.glob) and Google Cloud Storage
   (i.e., gs://...) path via gfile.glob(...).
   """
-  return _choose_backend(pattern).glob(pattern)
+  backend = get_backend(pattern)
+  return list(_memoize(backend, 'glob', pattern, backend.glob))
 
 
 def exists(path: PathType) -> bool:
   """Similar to os.path.exists(path), but supports both local path and
   remote path (Google Cloud Storage, gs://...) via gfile.exists(...).
   """
-  return _choose_backend(path).exists(path)
+  backend = get_backend(path)
+  return _memoize(backend, 'exists', path, backend.exists)
 
 
 def isdir(path: PathType):
   """Similar to os.path.isdir(path), but supports both local path and
   remote path (Google Cloud Storage, gs://...) via gfile.isdir(...).
   """
-  return _choose_backend(path).isdir(path)
+  backend = get_backend(path)
+  return _memoize(backend, 'isdir', path, backend.isdir)
 
 
 # pylint: disable-next=redefined-builtin
@@ -480,4 +1106,79 @@ def open(path: PathType, *, mode='r'):
   """Similar to built-in open(...), but supports Google Cloud Storage
   (i.e., gs://...) path via gfile.GFile(...) as well as local path.
   """
-  return _choose_backend(path).open(path, mode=mode)
+  return get_backend(path).open(path, mode=mode)
+
+
+def stat(path: PathType) -> FileStat:
+  """Return the size and the modification time of a (remote) file."""
+  backend = get_backend(path)
+  return _memoize(backend, 'stat', path, backend.stat)
+
+
+def open_cached(path: PathType, *, mode='r'):
+  """Similar to open(...) for reading, but remote files are read through
+  the local-disk file cache (see LocalFileCache), so re-reading a remote file
+  that has not changed costs only a stat call.
+
+  Local files, or files whose modification time cannot be determined,
+  are opened directly without caching.
+  """
+  if mode not in ('r', 'rb'):
+    raise ValueError(f"Unsupported mode for open_cached: {mode}")
+
+  backend = get_backend(path)
+  if USE_FILE_CACHE and not isinstance(backend, LocalPathUtil):
+    try:
+      with _metadata_cache.bypass():  # Must be fresh to validate the cache.
+        st = stat(path)
+    except NotImplementedError:
+      st = None
+    if st is not None and st.mtime is not None:
+      local_path = file_cache.fetch(path, st)
+      return LocalPathUtil().open(local_path, mode=mode)
+
+  return backend.open(path, mode=mode)
+
+
+@contextlib.asynccontextmanager
+async def asession():
+  """An asynchronous version of session(), within which remote connections
+  can be shared by all the concurrent tasks in the event loop."""
+  async with SFTPPathUtil.asession():
+    with _metadata_cache.session():
+      yield
+
+
+async def aglob(pattern: PathType) -> Sequence[str]:
+  """An asynchronous version of glob()."""
+  backend = get_backend(pattern)
+  return list(await _amemoize(backend, 'glob', pattern, backend.aglob))
+
+
+async def aexists(path: PathType) -> bool:
+  """An asynchronous version of exists()."""
+  backend = get_backend(path)
+  return await _amemoize(backend, 'exists', path, backend.aexists)
+
+
+async def aisdir(path: PathType) -> bool:
+  """An asynchronous version of isdir()."""
+  backend = get_backend(path)
+  return await _amemoize(backend, 'isdir', path, backend.aisdir)
+
+
+def aopen(path: PathType, *, mode='r'):
+  """An asynchronous version of open(), as an async context manager.
+
+  The file object yielded has asynchronous `read()` methods, e.g.:
+
+    >>> async with path_util.aopen(path) as f:
+    ...   content = await f.read()
+  """
+  return get_backend(path).aopen(path, mode=mode)
+
+
+async def adownload(path: PathType, tmpdir: str) -> str:
+  """Download a (remote) file into a local directory `tmpdir`, and return
+  the path of the local file."""
+  return await get_backend(path).adownload(path, tmpdir)
@@ -1,5 +1,6 @@
 """Tests for expt.path_util."""
 
+import asyncio
 import json
 import os
 from pathlib import Path
@@ -55,6 +56,175 @@ def test_local_file():
     assert 'episode_rewards' in line
 
 
+@pytest.mark.asyncio
+async def test_local_file_async(tmp_path: Path):
+  """Tests the asynchronous API on local files."""
+  PROGRESS_CSV = FIXTURE_PATH / "sample_csv/progress.csv"
+
+  assert str(PROGRESS_CSV) in V(await P.aglob(FIXTURE_PATH / "*/*.csv"))
+  assert await P.aexists(PROGRESS_CSV)
+  assert not await P.aexists(FIXTURE_PATH / "__NOT_EXIST__")
+  assert await P.aisdir(FIXTURE_PATH / "sample_csv")
+  assert not await P.aisdir(PROGRESS_CSV)
+
+  async with P.aopen(PROGRESS_CSV) as f:
+    line = await f.readline()
+    assert 'episode_rewards' in line
+
+  local_path = await P.adownload(PROGRESS_CSV, str(tmp_path))
+  assert local_path == str(tmp_path / "progress.csv")
+  assert Path(local_path).read_bytes() == PROGRESS_CSV.read_bytes()
+
+  # Many requests can be in flight at once.
+  async with P.asession():
+    results = await asyncio.gather(*[
+        P.aexists(FIXTURE_PATH / f"sample_csv/{i}.csv") for i in range(100)
+    ])
+  assert not any(results)
+
+
+def test_metadata_cache(tmp_path: Path, monkeypatch):
+  """Tests caching of (remote) file metadata within a session."""
+  fsspec = pytest.importorskip("fsspec")
+
+  fs = fsspec.filesystem("memory")
+  backend = P.register_backend(P.FsspecPathUtil(fs))
+  f = "memory://expt/metadata/progress.csv"
+  try:
+    with P.session():
+      assert not P.exists(f)
+      assert P.glob("memory://expt/metadata/*.csv") == []
+      fs.pipe("/expt/metadata/progress.csv", b"step\n0\n")
+
+      # Served from the cache until invalidated or expired.
+      assert not P.exists(f)
+      assert P.glob("memory://expt/metadata/*.csv") == []
+
+      P.clear_metadata_cache()
+      assert P.exists(f)
+      assert len(P.glob("memory://expt/metadata/*.csv")) == 1
+
+      with P.session():  # nested
+        fs.rm("/expt/metadata/progress.csv")
+      assert P.exists(f)
+
+      monkeypatch.setattr(P._metadata_cache, 'ttl', 0.0)
+      assert not P.exists(f)
+      monkeypatch.undo()
+
+      fs.pipe("/expt/metadata/progress.csv", b"step\n0\n")
+      assert not P.exists(f)
+
+    # No caching outside of a session, and cached entries are dropped
+    # when the outermost session exits.
+    assert P.exists(f)
+    with P.session():
+      assert P.exists(f)
+  finally:
+    P.unregister_backend(backend)
+
+  # Local files are never cached.
+  local_file = tmp_path / "progress.csv"
+  with P.session():
+    assert not P.exists(local_file)
+    local_file.touch()
+    assert P.exists(local_file)
+    assert P.glob(tmp_path / "*.csv") == [str(local_file)]
+
+  with pytest.raises(ValueError):
+    P.set_metadata_cache_ttl(-1)
+
+
+def test_fsspec_backend():
+  """Tests the fsspec adapter, with fsspec's in-memory filesystem."""
+  fsspec = pytest.importorskip("fsspec")
+
+  fs = fsspec.filesystem("memory")
+  fs.pipe("/expt/logs/run1/progress.csv", b"step,loss\n0,1.0\n")
+  fs.pipe("/expt/logs/run2/progress.csv", b"step,loss\n0,2.0\n")
+
+  with pytest.raises(ValueError):
+    P.FsspecPathUtil(fs, anon=True)
+
+  backend = P.register_backend(P.FsspecPathUtil(fs))
+  try:
+    assert P.get_backend("memory://expt/logs") is backend
+    assert isinstance(P.get_backend("/expt/logs"), P.LocalPathUtil)
+
+    assert V(P.glob("memory://expt/logs/*")) == [
+        "memory:///expt/logs/run1",
+        "memory:///expt/logs/run2",
+    ]
+    assert P.exists("memory://expt/logs/run1/progress.csv")
+    assert not P.exists("memory://expt/logs/run3")
+    assert P.isdir("memory://expt/logs/run1")
+    assert not P.isdir("memory://expt/logs/run1/progress.csv")
+
+    with P.open("memory://expt/logs/run2/progress.csv") as f:
+      assert f.readlines() == ["step,loss\n", "0,2.0\n"]
+    with P.open("memory://expt/logs/run2/progress.csv", mode='rb') as f:
+      assert f.read().startswith(b"step,loss")
+  finally:
+    P.unregister_backend(backend)
+
+  assert isinstance(P.get_backend("memory://expt/logs"), P.LocalPathUtil)
+
+
+def test_file_cache(tmp_path: Path, monkeypatch):
+  """Tests the local-disk cache of remote files (open_cached)."""
+  fsspec = pytest.importorskip("fsspec")
+
+  cache = P.LocalFileCache(str(tmp_path / "cache"), size_limit=1000)
+  monkeypatch.setattr(P, 'file_cache', cache)
+  monkeypatch.setattr(P, 'USE_FILE_CACHE', True)
+
+  fs = fsspec.filesystem("memory")
+  backend = P.register_backend(P.FsspecPathUtil(fs))
+  fetched = []
+  _original_open = backend.open
+  monkeypatch.setattr(backend, 'open', lambda path, *, mode='r': (
+      fetched.append(path), _original_open(path, mode=mode))[1])
+
+  def _read(path):
+    with P.open_cached(path) as f:
+      return f.read()
+
+  try:
+    fs.pipe("/expt/cache/progress.csv", b"step,loss\n0,1.0\n")
+    assert _read("memory://expt/cache/progress.csv") == "step,loss\n0,1.0\n"
+    assert _read("memory://expt/cache/progress.csv") == "step,loss\n0,1.0\n"
+    assert len(fetched) == 1, "should be read from the cache"
+
+    # A modified file should be fetched again, even if the metadata of
+    # the file is cached within a session.
+    with P.session():
+      assert P.stat("memory://expt/cache/progress.csv").size == 16
+      fs.pipe("/expt/cache/progress.csv", b"step,loss\n0,1.0\n1,0.5\n")
+      assert _read("memory://expt/cache/progress.csv").endswith("1,0.5\n")
+    assert len(fetched) == 2
+
+    # Least recently used entries are evicted over the size limit,
+    # where the cache directory is scanned only when it is likely full.
+    evicted = []
+    _original_evict = cache.evict
+    monkeypatch.setattr(cache, 'evict', lambda keep=None: (
+        evicted.append(keep), _original_evict(keep=keep))[1])
+    for i in range(5):
+      fs.pipe(f"/expt/cache/{i}.csv", b"x" * 300)
+      _read(f"memory://expt/cache/{i}.csv")
+    entries = list((tmp_path / "cache").iterdir())
+    assert sum(e.stat().st_size for e in entries) <= 1000
+    assert len(entries) == 3
+    assert len(evicted) == 2
+  finally:
+    P.unregister_backend(backend)
+
+  # Local files are not cached.
+  with P.open_cached(FIXTURE_PATH / "sample_csv/progress.csv") as f:
+    assert 'episode_rewards' in f.readline()
+  assert len(list((tmp_path / "cache").iterdir())) == 3
+
+
 @pytest.mark.parametrize("protocol", ["sftp", "scp"])
 def test_ssh(protocol: str):
   """Tests sftp:// files."""
@@ -92,6 +262,33 @@ def test_ssh(protocol: str):
   glob = V(P.glob(uri_base + "/.ss*/*s*"))
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("protocol", ["sftp", "scp"])
+async def test_ssh_async(protocol: str, tmp_path: Path):
+  """Tests the asynchronous API on sftp:// files."""
+  pytest.importorskip("asyncssh")
+
+  hostname = os.environ.get("EXPT_SSH_HOST")
+  if not hostname:
+    pytest.skip("Requires SSH host setup for test")
+
+  port = os.environ.get("EXPT_SSH_PORT", "22")
+  uri_base = f"{protocol}://{hostname}:{port}"
+  bashrc = uri_base + "/.bashrc"
+
+  async with P.asession():
+    assert await P.aexists(bashrc) is True
+    assert await P.aexists(uri_base + "/__NOT_EXIST__") is False
+    assert await P.aisdir(uri_base + "/.ssh") is True
+    assert bashrc in V(await P.aglob(uri_base + "/.*bash*"))
+
+    async with P.aopen(bashrc) as f:
+      assert await f.read()
+
+    local_path = await P.adownload(bashrc, str(tmp_path))
+    assert os.path.exists(local_path)
+
+
 def test_ssh_session(monkeypatch):
   """By reusing a ssh connection, remote file operations should be faster
   by re-using the connection resource kept alive."""
@@ -417,6 +417,14 @@ class HypothesisPlotter:
     ## STEP 1. Prepare data (mean ± std)
     #
 
+    # If y is given, only the columns to plot are aligned and aggregated
+    # over their own steps, rather than the union of steps of all the columns.
+    columns: Optional[List[str]] = None
+    if 'y' in kwargs:
+      columns = [kwargs['y']] if isinstance(kwargs['y'], str) \
+        else list(kwargs['y'])
+    aggregate_kwargs = dict(columns=columns, x_column=kwargs.get('x', None))
+
     def _representative_and_err(h: Hypothesis) -> Tuple[
         pd.DataFrame,  # representative (mean)
         Tuple[pd.DataFrame, pd.DataFrame]  # error band range (stderr)
@@ -425,10 +433,10 @@ class HypothesisPlotter:
 
       representative: pd.DataFrame = (
           representative_fn(h) if representative_fn \
-          else cast(pd.DataFrame, h.mean(numeric_only=True))
+          else cast(pd.DataFrame, h.mean(**aggregate_kwargs))
       )
       err_range: Tuple[pd.DataFrame, pd.DataFrame]
-      std = err_fn(h) if err_fn else h.std(numeric_only=True)
+      std = err_fn(h) if err_fn else h.std(**aggregate_kwargs)
 
       # Condition check: when representative_fn is given,
       # err_fn should return a range (i.e., tuple)
@@ -441,7 +449,10 @@ class HypothesisPlotter:
             f"err_fn returned: {std}")
 
       if isinstance(std, pd.DataFrame):
-        mean = h.mean(numeric_only=True)
+        mean = h.mean(**aggregate_kwargs)
+        if columns is not None:
+          # err_fn may cover all the steps and columns (e.g. h.grouped.sem()).
+          std = std.reindex(index=mean.index, columns=mean.columns)
         err_range = (mean - std, mean + std)
         return representative, err_range
 
@@ -737,6 +748,7 @@ class HypothesisPlotter:
         for df in df_individuals:
           if yi not in df:
             continue
+          df = df[[x, yi] if x is not None else [yi]]
           if rolling:
             df = df.rolling(**_rolling_kwargs(rolling)).mean()
 
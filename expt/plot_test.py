@@ -157,6 +157,36 @@ class TestHypothesisPlot:
     with pytest.raises(ValueError, match="`video` has a non-numeric type"):
       hypothesis.plot(y=np.asarray(["loss", "video"], dtype=object))
 
+  def test_plot_sparse_columns(self, hypothesis: Hypothesis):
+    # A column logged every 1000 steps, while the others every 10 steps.
+    for r in hypothesis.runs:
+      r.df['eval'] = r.df['accuracy'].where(r.df['step'] % 1000 == 0)
+
+    # Only the steps where `eval` has values should be plotted.
+    g = hypothesis.plot(y='eval', err_style=None)
+    lines = g['eval'].get_lines()
+    assert len(lines) == 1
+    assert len(lines[0].get_xdata()) == 10
+
+    g = hypothesis.plot(x='step', y='eval', err_style='runs')
+    assert len(g['eval'].get_lines()) == 1 + len(hypothesis.runs)
+    for line in g['eval'].get_lines():
+      np.testing.assert_array_equal(line.get_xdata(),
+                                    np.arange(1000, 10001, 1000))
+
+    # With other columns, the union of their steps is used.
+    g = hypothesis.plot(y=['eval', 'loss'], err_style=None)
+    assert len(g['eval'].get_lines()[0].get_xdata()) == 1000
+
+    # The error band from err_fn is around the mean of the same columns.
+    g = hypothesis.plot(y='eval',
+                        err_style='band',
+                        err_fn=lambda h: h.grouped.sem())
+    assert len(g['eval'].get_lines()) == 1
+    assert len(g['eval'].get_lines()[0].get_xdata()) == 10
+    band, = g['eval'].collections
+    assert len(band.get_paths()[0].vertices) < 30
+
   def test_grid_spec(self, hypothesis: Hypothesis):
     # single y
     g = hypothesis.plot(y="loss")
@@ -1,15 +1,18 @@
 """Utilities for expt."""
 
 import asyncio
-import collections
 import concurrent.futures
 import contextlib
 import functools
-from typing import Callable, Collection, List, Optional, TypeVar
+import itertools
+import os
+from typing import (Callable, Collection, Iterable, List, Optional,
+                    TypeVar)
 import warnings
 
 from typeguard import typechecked
 
+S = TypeVar('S')
 T = TypeVar('T')
 
 # Make DeprecationWarning within expt printed, but only once
@@ -55,10 +58,7 @@ def merge_list(*lists):
   """Merge given lists into one without duplicated entries. Orders are
   preserved as in the order of each of the flattened elements appear."""
 
-  merged = {}
-  for item in lists:
-    merged.update(collections.OrderedDict.fromkeys(item))
-  return list(merged)
+  return list(dict.fromkeys(itertools.chain.from_iterable(lists)))
 
 
 def ensure_unique(items: Collection[T]) -> T:
@@ -117,3 +117,31 @@ def wrap_async(blocking_fn: Callable):
 
   wrapped._executor = executor
   return wrapped
+
+
+def map_parallel(
+    fn: Callable[[S], T],
+    items: Iterable[S],
+    *,
+    n_jobs: int = 1,
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> List[T]:
+  """Apply `fn` to each of `items` and return the results in order.
+
+  By default (n_jobs=1) this is a plain serial loop. With n_jobs > 1 (or -1
+  for as many as CPUs), a thread pool is used; this works well for
+  numpy/pandas-heavy work as numpy releases the GIL. Alternatively, any
+  concurrent.futures.Executor (e.g. ProcessPoolExecutor, in which case `fn`
+  and `items` must be picklable) can be given as `executor`.
+  """
+  items = list(items)
+  if executor is not None:
+    return list(executor.map(fn, items))
+
+  if n_jobs < 0:
+    n_jobs = os.cpu_count() or 1
+  if n_jobs <= 1 or len(items) <= 1:
+    return [fn(item) for item in items]
+  max_workers = min(n_jobs, len(items))
+  with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+    return list(pool.map(fn, items))
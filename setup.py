@@ -82,6 +82,8 @@ tests_requires = [
     'tensorboard>=2.3',
     'fabric>=3.0',
     'paramiko>=2.8',
+    'asyncssh>=2.13',
+    'fsspec',
 ]
 
 